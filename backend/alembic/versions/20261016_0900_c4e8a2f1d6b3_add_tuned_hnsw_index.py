@@ -0,0 +1,37 @@
+"""
+Add tuned HNSW index on chunks.embedding
+
+Revision ID: c4e8a2f1d6b3
+Revises: b3d9f1e7a2b0
+Create Date: 2026-10-16 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a2f1d6b3"
+down_revision: Union[str, None] = "b3d9f1e7a2b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Session-level build settings; HNSW builds are memory-hungry
+        op.execute("SET maintenance_work_mem = '2GB'")
+        op.execute("SET max_parallel_maintenance_workers = 7")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hnsw
+            ON chunks USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 24, ef_construction = 128)
+        """)
+        op.execute("RESET maintenance_work_mem")
+        op.execute("RESET max_parallel_maintenance_workers")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding_hnsw")
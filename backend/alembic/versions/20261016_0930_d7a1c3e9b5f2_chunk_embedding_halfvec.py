@@ -0,0 +1,45 @@
+"""
+Store chunks.embedding as halfvec(1536)
+
+Revision ID: d7a1c3e9b5f2
+Revises: c4e8a2f1d6b3
+Create Date: 2026-10-16 09:30:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a1c3e9b5f2"
+down_revision: Union[str, None] = "c4e8a2f1d6b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The HNSW index is bound to vector_cosine_ops; drop it before retyping
+    op.execute("DROP INDEX IF EXISTS idx_chunks_embedding_hnsw")
+    op.execute(
+        "ALTER TABLE chunks ALTER COLUMN embedding TYPE halfvec(1536) "
+        "USING embedding::halfvec(1536)"
+    )
+    op.execute("SET maintenance_work_mem = '2GB'")
+    op.execute("""
+        CREATE INDEX idx_chunks_embedding_hnsw
+        ON chunks USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """)
+    op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_chunks_embedding_hnsw")
+    op.execute(
+        "ALTER TABLE chunks ALTER COLUMN embedding TYPE vector(1536) "
+        "USING embedding::vector(1536)"
+    )
+    op.execute("""
+        CREATE INDEX idx_chunks_embedding_hnsw
+        ON chunks USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """)
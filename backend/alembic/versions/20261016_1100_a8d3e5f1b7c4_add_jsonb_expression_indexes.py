@@ -0,0 +1,38 @@
+"""
+Add GIN indexes for nested JSONB lookups on pipelines and presets
+
+Revision ID: a8d3e5f1b7c4
+Revises: f5c9d2a7e3b1
+Create Date: 2026-10-16 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d3e5f1b7c4"
+down_revision: Union[str, None] = "f5c9d2a7e3b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Node-type lookups: nodes @> '[{"type": "..."}]'
+    op.create_index(
+        "idx_pipelines_nodes_gin",
+        "pipelines",
+        ["nodes"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"nodes": "jsonb_path_ops"},
+    )
+    # Chunking-method lookups: (configuration -> 'chunking') @> '{"method": "..."}'
+    op.execute("""
+        CREATE INDEX idx_presets_config_chunking_gin
+        ON presets USING gin ((configuration -> 'chunking') jsonb_path_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_presets_config_chunking_gin")
+    op.drop_index("idx_pipelines_nodes_gin", table_name="pipelines", postgresql_using="gin")
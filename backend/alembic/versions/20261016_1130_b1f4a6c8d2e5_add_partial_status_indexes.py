@@ -0,0 +1,52 @@
+"""
+Replace evaluations.status btree with partial indexes on active rows
+
+Revision ID: b1f4a6c8d2e5
+Revises: a8d3e5f1b7c4
+Create Date: 2026-10-16 11:30:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b1f4a6c8d2e5"
+down_revision: Union[str, None] = "a8d3e5f1b7c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The full-status btree is dominated by completed rows
+    op.drop_index(op.f("ix_evaluations_status"), table_name="evaluations")
+    op.create_index(
+        "idx_evaluations_active",
+        "evaluations",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+    op.create_index(
+        "idx_pipelines_active",
+        "pipelines",
+        ["updated_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('draft', 'running')"),
+    )
+    op.create_index(
+        "idx_documents_unprocessed",
+        "documents",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_processed = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_documents_unprocessed", table_name="documents")
+    op.drop_index("idx_pipelines_active", table_name="pipelines")
+    op.drop_index("idx_evaluations_active", table_name="evaluations")
+    op.create_index(
+        op.f("ix_evaluations_status"), "evaluations", ["status"], unique=False
+    )
@@ -0,0 +1,46 @@
+"""
+Use server-side now() defaults for created_at columns
+
+Revision ID: c2e7b9d4f6a8
+Revises: b1f4a6c8d2e5
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e7b9d4f6a8"
+down_revision: Union[str, None] = "b1f4a6c8d2e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = [
+    "pipeline_versions",
+    "chunks",
+    "evaluations",
+    "evaluation_results",
+    "execution_logs",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=sa.text("now()"),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
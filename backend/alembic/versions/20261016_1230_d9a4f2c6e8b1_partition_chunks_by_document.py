@@ -0,0 +1,122 @@
+"""
+Hash-partition chunks by document_id
+
+Revision ID: d9a4f2c6e8b1
+Revises: c2e7b9d4f6a8
+Create Date: 2026-10-16 12:30:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a4f2c6e8b1"
+down_revision: Union[str, None] = "c2e7b9d4f6a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+
+def _create_indexes_and_trigger() -> None:
+    op.execute("CREATE INDEX ix_chunks_document_id ON chunks (document_id)")
+    op.execute("CREATE INDEX ix_chunks_parent_chunk_id ON chunks (parent_chunk_id)")
+    op.execute("CREATE INDEX ix_chunks_tsv ON chunks USING gin (tsv)")
+    op.execute(
+        "CREATE INDEX idx_chunks_metadata_gin ON chunks "
+        "USING gin (metadata jsonb_path_ops)"
+    )
+    op.execute("""
+        CREATE TRIGGER tsvectorupdate BEFORE INSERT OR UPDATE
+        ON chunks FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(tsv, 'pg_catalog.english', text);
+    """)
+
+
+def upgrade() -> None:
+    # 1. New partitioned parent. The partition key must be part of every
+    #    unique constraint, so the PK becomes (document_id, id) and the
+    #    parent_chunk_id self-reference can no longer be a foreign key.
+    op.execute("""
+        CREATE TABLE chunks_partitioned (
+            LIKE chunks INCLUDING DEFAULTS,
+            CONSTRAINT pk_chunks_partitioned PRIMARY KEY (document_id, id),
+            CONSTRAINT fk_chunks_document_id_documents_p FOREIGN KEY (document_id)
+                REFERENCES documents (id) ON DELETE CASCADE,
+            CONSTRAINT fk_chunks_pipeline_version_id_pipeline_versions_p
+                FOREIGN KEY (pipeline_version_id)
+                REFERENCES pipeline_versions (id) ON DELETE SET NULL
+        ) PARTITION BY HASH (document_id)
+    """)
+    for i in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE chunks_p{i} PARTITION OF chunks_partitioned "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {i})"
+        )
+
+    # 2. Copy rows; tsv is already populated so the trigger is not needed yet
+    op.execute("INSERT INTO chunks_partitioned SELECT * FROM chunks")
+
+    # 3. Swap tables. The self-referencing FK is the only known dependent;
+    #    no CASCADE, so anything unexpected fails the migration instead of
+    #    being dropped silently.
+    op.execute("ALTER TABLE chunks DROP CONSTRAINT fk_chunks_parent_chunk_id")
+    op.execute("DROP TABLE chunks")
+    op.execute("ALTER TABLE chunks_partitioned RENAME TO chunks")
+    op.execute("ALTER TABLE chunks RENAME CONSTRAINT pk_chunks_partitioned TO pk_chunks")
+    op.execute(
+        "ALTER TABLE chunks RENAME CONSTRAINT fk_chunks_document_id_documents_p "
+        "TO fk_chunks_document_id_documents"
+    )
+    op.execute(
+        "ALTER TABLE chunks RENAME CONSTRAINT "
+        "fk_chunks_pipeline_version_id_pipeline_versions_p "
+        "TO fk_chunks_pipeline_version_id_pipeline_versions"
+    )
+
+    # 4. Indexes on the parent cascade to every partition. The embedding
+    #    ANN index is not rebuilt: e6b2d8f4a1c7 moves vectors to
+    #    chunk_embeddings and indexes them there. ix_chunks_id serves
+    #    lookups by id alone, which the (document_id, id) PK cannot.
+    _create_indexes_and_trigger()
+    op.execute("CREATE INDEX ix_chunks_id ON chunks (id)")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE chunks_plain (
+            LIKE chunks INCLUDING DEFAULTS,
+            CONSTRAINT pk_chunks_plain PRIMARY KEY (id),
+            CONSTRAINT fk_chunks_document_id_documents_p FOREIGN KEY (document_id)
+                REFERENCES documents (id) ON DELETE CASCADE,
+            CONSTRAINT fk_chunks_pipeline_version_id_pipeline_versions_p
+                FOREIGN KEY (pipeline_version_id)
+                REFERENCES pipeline_versions (id) ON DELETE SET NULL
+        )
+    """)
+    op.execute("INSERT INTO chunks_plain SELECT * FROM chunks")
+    # Partitions and ix_chunks_id go with the parent; nothing else depends on it
+    op.execute("DROP TABLE chunks")
+    op.execute("ALTER TABLE chunks_plain RENAME TO chunks")
+    op.execute("ALTER TABLE chunks RENAME CONSTRAINT pk_chunks_plain TO pk_chunks")
+    op.execute(
+        "ALTER TABLE chunks RENAME CONSTRAINT fk_chunks_document_id_documents_p "
+        "TO fk_chunks_document_id_documents"
+    )
+    op.execute(
+        "ALTER TABLE chunks RENAME CONSTRAINT "
+        "fk_chunks_pipeline_version_id_pipeline_versions_p "
+        "TO fk_chunks_pipeline_version_id_pipeline_versions"
+    )
+    op.execute("""
+        ALTER TABLE chunks ADD CONSTRAINT fk_chunks_parent_chunk_id
+        FOREIGN KEY (parent_chunk_id) REFERENCES chunks (id) ON DELETE SET NULL
+    """)
+    _create_indexes_and_trigger()
+    op.execute("SET maintenance_work_mem = '2GB'")
+    op.execute("""
+        CREATE INDEX idx_chunks_embedding_hnsw ON chunks
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """)
+    op.execute("RESET maintenance_work_mem")
@@ -0,0 +1,65 @@
+"""
+Move chunk embeddings into chunk_embeddings
+
+Revision ID: e6b2d8f4a1c7
+Revises: d9a4f2c6e8b1
+Create Date: 2026-10-16 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2d8f4a1c7"
+down_revision: Union[str, None] = "d9a4f2c6e8b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Vector side table; document_id is carried so the FK can target the
+    #    partitioned chunks key and filtered searches skip the join
+    op.execute("""
+        CREATE TABLE chunk_embeddings (
+            chunk_id UUID NOT NULL,
+            document_id UUID NOT NULL,
+            embedding halfvec(1536) NOT NULL,
+            CONSTRAINT pk_chunk_embeddings PRIMARY KEY (chunk_id),
+            CONSTRAINT fk_chunk_embeddings_document_id_chunks
+                FOREIGN KEY (document_id, chunk_id)
+                REFERENCES chunks (document_id, id) ON DELETE CASCADE
+        )
+    """)
+
+    # 2. Copy existing vectors
+    op.execute("""
+        INSERT INTO chunk_embeddings (chunk_id, document_id, embedding)
+        SELECT id, document_id, embedding FROM chunks WHERE embedding IS NOT NULL
+    """)
+
+    # 3. Indexes after the bulk load
+    op.execute(
+        "CREATE INDEX ix_chunk_embeddings_document_id "
+        "ON chunk_embeddings (document_id)"
+    )
+    op.execute("SET maintenance_work_mem = '2GB'")
+    op.execute("""
+        CREATE INDEX idx_chunk_embeddings_hnsw ON chunk_embeddings
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """)
+    op.execute("RESET maintenance_work_mem")
+    op.execute("ANALYZE chunk_embeddings")
+
+    # 4. Drop the column from chunks (d9a4f2c6e8b1 left it unindexed)
+    op.execute("ALTER TABLE chunks DROP COLUMN embedding")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE chunks ADD COLUMN embedding halfvec(1536)")
+    op.execute("""
+        UPDATE chunks c SET embedding = e.embedding
+        FROM chunk_embeddings e
+        WHERE c.document_id = e.document_id AND c.id = e.chunk_id
+    """)
+    op.execute("DROP TABLE chunk_embeddings")
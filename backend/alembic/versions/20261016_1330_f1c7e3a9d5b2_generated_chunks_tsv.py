@@ -0,0 +1,41 @@
+"""
+Make chunks.tsv a generated column
+
+Revision ID: f1c7e3a9d5b2
+Revises: e6b2d8f4a1c7
+Create Date: 2026-10-16 13:30:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c7e3a9d5b2"
+down_revision: Union[str, None] = "e6b2d8f4a1c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trigger is replaced by a STORED generated column; dropping the
+    # column also drops ix_chunks_tsv on the parent and every partition.
+    op.execute("DROP TRIGGER IF EXISTS tsvectorupdate ON chunks")
+    op.execute("ALTER TABLE chunks DROP COLUMN tsv")
+    op.execute("""
+        ALTER TABLE chunks ADD COLUMN tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', coalesce(text, ''))) STORED
+    """)
+    op.execute("CREATE INDEX idx_chunks_tsv ON chunks USING gin (tsv)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_chunks_tsv")
+    op.execute("ALTER TABLE chunks DROP COLUMN tsv")
+    op.execute("ALTER TABLE chunks ADD COLUMN tsv tsvector")
+    op.execute("UPDATE chunks SET tsv = to_tsvector('english', COALESCE(text, ''))")
+    op.execute("CREATE INDEX ix_chunks_tsv ON chunks USING gin (tsv)")
+    op.execute("""
+        CREATE TRIGGER tsvectorupdate BEFORE INSERT OR UPDATE
+        ON chunks FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(tsv, 'pg_catalog.english', text);
+    """)
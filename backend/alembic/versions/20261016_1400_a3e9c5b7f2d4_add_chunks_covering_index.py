@@ -0,0 +1,35 @@
+"""
+Add covering (document_id, chunk_index) index on chunks
+
+Revision ID: a3e9c5b7f2d4
+Revises: f1c7e3a9d5b2
+Create Date: 2026-10-16 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3e9c5b7f2d4"
+down_revision: Union[str, None] = "f1c7e3a9d5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX idx_chunks_doc_idx_covering
+        ON chunks (document_id, chunk_index)
+        INCLUDE (token_count, chunk_size)
+    """)
+    # Same leading column; the covering index takes over its lookups
+    op.execute("DROP INDEX IF EXISTS ix_chunks_document_id")
+
+    # Index-only scans need an up-to-date visibility map
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM ANALYZE chunks")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX ix_chunks_document_id ON chunks (document_id)")
+    op.execute("DROP INDEX IF EXISTS idx_chunks_doc_idx_covering")
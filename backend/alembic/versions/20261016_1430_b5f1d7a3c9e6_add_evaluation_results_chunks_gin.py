@@ -0,0 +1,31 @@
+"""
+Add GIN index on evaluation_results.retrieved_chunk_ids
+
+Revision ID: b5f1d7a3c9e6
+Revises: a3e9c5b7f2d4
+Create Date: 2026-10-16 14:30:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5f1d7a3c9e6"
+down_revision: Union[str, None] = "a3e9c5b7f2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Default array_ops opclass: supports @>, <@ and && on uuid[]
+    op.create_index(
+        "idx_evalres_chunks_gin",
+        "evaluation_results",
+        ["retrieved_chunk_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_evalres_chunks_gin", table_name="evaluation_results")
@@ -0,0 +1,49 @@
+"""
+Store evaluation costs as double precision
+
+Revision ID: c8a2e4f6b9d1
+Revises: b5f1d7a3c9e6
+Create Date: 2026-10-16 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c8a2e4f6b9d1"
+down_revision: Union[str, None] = "b5f1d7a3c9e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # float8 aggregates run natively; numeric arithmetic is digit-by-digit.
+    # Micro-dollar precision is well inside float8's 15 significant digits.
+    op.alter_column(
+        "evaluations",
+        "total_cost_usd",
+        type_=sa.Float(),
+        existing_type=sa.Numeric(10, 6),
+    )
+    op.alter_column(
+        "evaluation_results",
+        "cost_usd",
+        type_=sa.Float(),
+        existing_type=sa.Numeric(10, 6),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "evaluation_results",
+        "cost_usd",
+        type_=sa.Numeric(10, 6),
+        existing_type=sa.Float(),
+    )
+    op.alter_column(
+        "evaluations",
+        "total_cost_usd",
+        type_=sa.Numeric(10, 6),
+        existing_type=sa.Float(),
+    )
@@ -0,0 +1,58 @@
+"""
+Store chunks.chunking_method as VARCHAR with a CHECK constraint
+
+Revision ID: d4b8f2a6c1e3
+Revises: c8a2e4f6b9d1
+Create Date: 2026-10-16 15:30:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b8f2a6c1e3"
+down_revision: Union[str, None] = "c8a2e4f6b9d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.models.ChunkingMethod; new methods only need this CHECK updated
+CHUNKING_METHODS = (
+    "fixed_size", "recursive", "semantic", "sentence", "paragraph",
+    "markdown", "code", "table", "heading", "agentic",
+    "paragraph_based", "heading_based", "code_aware", "sentence_window", "fixed",
+)
+
+# Values present in the original PG enum type
+ORIGINAL_METHODS = CHUNKING_METHODS[:10]
+
+
+def _in_list(values: Sequence[str]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE chunks
+        ALTER COLUMN chunking_method TYPE VARCHAR(32)
+        USING chunking_method::text
+    """)
+    op.execute(f"""
+        ALTER TABLE chunks ADD CONSTRAINT ck_chunks_chunking_method
+        CHECK (chunking_method IN ({_in_list(CHUNKING_METHODS)}))
+    """)
+    op.execute("DROP TYPE IF EXISTS chunking_method")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE chunks DROP CONSTRAINT IF EXISTS ck_chunks_chunking_method")
+    op.execute(f"CREATE TYPE chunking_method AS ENUM ({_in_list(ORIGINAL_METHODS)})")
+    # Preset-only methods were never part of the enum type; they are cleared
+    op.execute(f"""
+        UPDATE chunks SET chunking_method = NULL
+        WHERE chunking_method NOT IN ({_in_list(ORIGINAL_METHODS)})
+    """)
+    op.execute("""
+        ALTER TABLE chunks
+        ALTER COLUMN chunking_method TYPE chunking_method
+        USING chunking_method::chunking_method
+    """)
@@ -0,0 +1,31 @@
+"""
+Add documents.content_hash for duplicate upload detection
+
+Revision ID: e7c3a9d5b2f8
+Revises: d4b8f2a6c1e3
+Create Date: 2026-10-16 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c3a9d5b2f8"
+down_revision: Union[str, None] = "d4b8f2a6c1e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("content_hash", sa.String(32), nullable=True))
+    op.create_index(
+        "idx_documents_user_content_hash",
+        "documents",
+        ["user_id", "content_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_documents_user_content_hash", table_name="documents")
+    op.drop_column("documents", "content_hash")
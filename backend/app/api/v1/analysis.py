@@ -83,19 +83,29 @@ async def analyze_document(
         # Note: document_service usually requires a user_id, but we'll manually create the Document object here
         # to ensure we use our retrieved/created current_user
         
-        file_type = await document_service.validate_upload(file)
-        stored_filename, file_path, file_size = await document_service.save_file(file, file_type)
+        saved = await document_service.validate_and_save(file)
+        file_path = saved.file_path
         temp_path = file_path # Keep track for cleanup if needed
         
+        existing = None
         if current_user:
+            existing = await document_service.find_duplicate(db, current_user.id, saved.content_hash)
+        
+        if existing is not None:
+            # Same bytes uploaded before: analyze the stored copy, skip re-processing
+            Path(saved.file_path).unlink(missing_ok=True)
+            file_path = existing.file_path
+            document_id = existing.id
+        elif current_user:
             # Create Document record linked to the user
             document = Document(
                 user_id=current_user.id,
-                filename=stored_filename,
+                filename=saved.filename,
                 original_filename=file.filename or "unknown",
                 file_path=file_path,
-                file_type=file_type.value,
-                file_size_bytes=file_size,
+                file_type=saved.file_type.value,
+                file_size_bytes=saved.size_bytes,
+                content_hash=saved.content_hash,
                 doc_metadata={},
                 is_processed=False,
             )
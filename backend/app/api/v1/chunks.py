@@ -6,12 +6,12 @@ import time
 from uuid import UUID
 
 from fastapi import APIRouter, Query
-from sqlalchemy import func, select, text
+from sqlalchemy import func, lambda_stmt, select
 
 from app.core.errors import BadRequestError, NotFoundError
 from app.core.logging import get_logger
 from app.dependencies import CurrentUser, DbSession
-from app.models import Chunk, Document
+from app.models import Chunk, ChunkEmbedding, Document
 from app.schemas import (
     ChunkingConfig,
     ChunkListResponse,
@@ -24,6 +24,8 @@ from app.schemas import (
     PaginationParams,
     paginate,
 )
+from app.schemas.document import CHUNK_LIST_ADAPTER
+from app.services.retrievers.vector_index import query_vector, tune_vector_search
 
 logger = get_logger(__name__)
 
@@ -90,8 +92,8 @@ async def visualize_chunks(
         logger.error(f"Failed to re-extract PDF for visualization: {e}")
         raise BadRequestError(f"Failed to process PDF: {e}")
 
-    # flattened_chars: list of (char, page_num, pdf_bbox)
-    # pdf_bbox is [x0, y0, x1, y1]
+    # flattened_chars: list of {"char", "page", "bbox"}
+    # bbox is (x, y, width, height)
     flattened_chars = []
     full_text = ""
     
@@ -106,13 +108,15 @@ async def visualize_chunks(
         for block in sorted_blocks:
             for line in block.lines:
                 for span in line.spans:
-                    if span.characters:
-                        for char_info in span.characters:
-                            full_text += char_info.char
+                    chars = span.char_array
+                    if chars is not None and len(chars):
+                        # Read the structured array directly; no per-char models
+                        for char, x, y, w, h, _size, _color in chars.tolist():
+                            full_text += char
                             flattened_chars.append({
-                                "char": char_info.char,
+                                "char": char,
                                 "page": page_num,
-                                "bbox": char_info  # has x, y, width, height
+                                "bbox": (x, y, w, h),
                             })
                     else:
                         # Fallback if no chars (shouldn't happen with extract_characters=True)
@@ -163,31 +167,31 @@ async def visualize_chunks(
             if item is None:
                 continue
                 
-            char_info = item["bbox"]
+            char_x, char_y, char_w, char_h = item["bbox"]
             page = item["page"]
             
-            if current_rect and current_rect.page == page and abs(current_rect.y - char_info.y) < 5:
+            if current_rect and current_rect.page == page and abs(current_rect.y - char_y) < 5:
                 curr_x0 = current_rect.x
                 curr_x1 = current_rect.x + current_rect.width
-                new_x0 = char_info.x
-                new_x1 = char_info.x + char_info.width
+                new_x0 = char_x
+                new_x1 = char_x + char_w
                 
                 final_x0 = min(curr_x0, new_x0)
                 final_x1 = max(curr_x1, new_x1)
                 
                 current_rect.x = final_x0
                 current_rect.width = final_x1 - final_x0
-                current_rect.height = max(current_rect.height, char_info.height)
+                current_rect.height = max(current_rect.height, char_h)
             else:
                 if current_rect:
                     bboxes.append(current_rect)
                 
                 current_rect = ChunkBBox(
                     page=page,
-                    x=char_info.x,
-                    y=char_info.y,
-                    width=char_info.width,
-                    height=char_info.height
+                    x=char_x,
+                    y=char_y,
+                    width=char_w,
+                    height=char_h
                 )
         
         if current_rect:
@@ -242,33 +246,40 @@ async def list_document_chunks(
     """List all chunks for a document."""
     params = PaginationParams(page=page, per_page=per_page)
     
+    # Hot path: lambda statements are compiled once and cached; only the
+    # bound parameters change between calls.
+    user_id = current_user.id
+    offset, per_page = params.offset, params.per_page
+    
     # Verify document ownership
     doc_result = await db.execute(
-        select(Document).where(
+        lambda_stmt(lambda: select(Document).where(
             Document.id == document_id,
-            Document.user_id == current_user.id,
-        )
+            Document.user_id == user_id,
+        ))
     )
     if not doc_result.scalar_one_or_none():
         raise NotFoundError("Document", str(document_id))
     
-    # Count total
-    count_query = select(func.count(Chunk.id)).where(Chunk.document_id == document_id)
+    # Count total; count(*) touches only document_id, so it is answered by
+    # an index-only scan on idx_chunks_doc_idx_covering
+    count_query = lambda_stmt(
+        lambda: select(func.count()).select_from(Chunk).where(Chunk.document_id == document_id)
+    )
     total = (await db.execute(count_query)).scalar() or 0
     
     # Fetch chunks
-    query = (
-        select(Chunk)
+    query = lambda_stmt(
+        lambda: select(Chunk)
         .where(Chunk.document_id == document_id)
         .order_by(Chunk.chunk_index)
-        .offset(params.offset)
-        .limit(params.per_page)
     )
+    query += lambda q: q.offset(offset).limit(per_page)
     result = await db.execute(query)
     chunks = result.scalars().all()
     
     return paginate(
-        items=[ChunkResponse.model_validate(c) for c in chunks],
+        items=CHUNK_LIST_ADAPTER.validate_python(chunks, from_attributes=True),
         total=total,
         params=params,
     )
@@ -317,26 +328,26 @@ async def search_similar_chunks(
         if len(embedding_values) != 1536:
             raise ValueError(f"Expected 1536 dimensions, got {len(embedding_values)}")
     except ValueError as e:
-        raise ValueError(f"Invalid embedding format: {e}")
+        raise BadRequestError(f"Invalid embedding format: {e}")
     
     # Build query with cosine similarity
-    embedding_str = f"[{','.join(map(str, embedding_values))}]"
+    distance = ChunkEmbedding.embedding.cosine_distance(query_vector(embedding_values))
+    order = await tune_vector_search(db, distance, limit, document_id)
     
     base_query = (
-        select(
-            Chunk,
-            (1 - Chunk.embedding.cosine_distance(text(f"'{embedding_str}'::vector"))).label("similarity")
-        )
+        select(Chunk, (1 - distance).label("similarity"))
+        .join(Chunk.embedding_record)
         .join(Document)
         .where(Document.user_id == current_user.id)
     )
     
     if document_id:
-        base_query = base_query.where(Chunk.document_id == document_id)
+        base_query = base_query.where(ChunkEmbedding.document_id == document_id)
     
+    # Raw distance uses the HNSW index; selective filters get an exact sort
     query = (
         base_query
-        .order_by(text("similarity DESC"))
+        .order_by(order)
         .limit(limit)
     )
     
@@ -5,7 +5,8 @@ CRUD operations for uploaded documents
 from uuid import UUID
 import pathlib
 
-from fastapi import APIRouter, Query, UploadFile, File, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Query, UploadFile, File, HTTPException, Response, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 
 from app.core.errors import BadRequestError, NotFoundError, PermissionDeniedError
@@ -26,10 +27,14 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+# Characters per slice when streaming extracted text
+TEXT_STREAM_SLICE_CHARS = 64 * 1024
+
 
 @router.post("/upload", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
     background_tasks: BackgroundTasks,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
     file: UploadFile = File(..., description="PDF, TXT, or MD file to upload"),
@@ -37,23 +42,15 @@ async def upload_document(
     """
     Upload a document for processing.
     
-    Accepts PDF, TXT, and MD files up to 100MB.
+    Accepts PDF, TXT, and MD files up to 100MB. Re-uploading bytes the user
+    already has returns that existing document (with its original filename)
+    with 200 instead of 201, and nothing is re-processed.
     """
-    # Validate file
+    # Validate and save file in a single pass over the upload
     try:
-        file_type = await document_service.validate_upload(file)
+        saved = await document_service.validate_and_save(file)
     except BadRequestError:
         raise
-    except Exception as e:
-        logger.error("upload_validation_failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File validation failed: {str(e)}"
-        )
-    
-    # Save file to disk
-    try:
-        stored_filename, file_path, file_size = await document_service.save_file(file, file_type)
     except Exception as e:
         logger.error("upload_save_failed", error=str(e))
         raise HTTPException(
@@ -61,14 +58,27 @@ async def upload_document(
             detail="Failed to save file"
         )
     
+    # Identical re-uploads reuse the existing document instead of re-processing
+    existing = await document_service.find_duplicate(db, current_user.id, saved.content_hash)
+    if existing is not None:
+        pathlib.Path(saved.file_path).unlink(missing_ok=True)
+        logger.info(
+            "document_upload_deduplicated",
+            document_id=str(existing.id),
+            filename=file.filename,
+        )
+        response.status_code = status.HTTP_200_OK
+        return DocumentResponse.model_validate(existing)
+    
     # Create database record
     document = Document(
         user_id=current_user.id,
-        filename=stored_filename,
+        filename=saved.filename,
         original_filename=file.filename or "unknown",
-        file_path=file_path,
-        file_type=file_type.value,
-        file_size_bytes=file_size,
+        file_path=saved.file_path,
+        file_type=saved.file_type.value,
+        file_size_bytes=saved.size_bytes,
+        content_hash=saved.content_hash,
         doc_metadata={},
         is_processed=False,
     )
@@ -80,7 +90,7 @@ async def upload_document(
         "document_uploaded",
         document_id=str(document.id),
         filename=file.filename,
-        size_bytes=file_size,
+        size_bytes=saved.size_bytes,
     )
     
     # Trigger processing in background
@@ -137,11 +147,10 @@ async def list_documents(
     rows = result.all()
     
     # Map to response schema
-    items = []
-    for doc, chunk_count in rows:
-        d_resp = DocumentResponse.model_validate(doc)
-        d_resp.chunk_count = chunk_count
-        items.append(d_resp)
+    items = [
+        DocumentResponse.model_validate(doc).model_copy(update={"chunk_count": chunk_count})
+        for doc, chunk_count in rows
+    ]
     
     return paginate(
         items=items,
@@ -201,6 +210,40 @@ async def get_document_content(
         raise e
 
 
+@router.get("/{document_id}/text")
+async def stream_document_text(
+    document_id: UUID,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Stream a document's extracted text as plain text.
+    
+    The column is read once and sent in fixed-size slices, so the client
+    starts receiving data before the whole body is encoded. Reading it with
+    one substr() query per slice would be quadratic: PostgreSQL detoasts
+    (and decompresses) the value from its start for every slice.
+    """
+    # Ownership check and text in one round trip, without loading the ORM row
+    row = (await db.execute(
+        select(Document.user_id, Document.extracted_text)
+        .where(Document.id == document_id)
+    )).one_or_none()
+    
+    if row is None:
+        raise NotFoundError("Document", str(document_id))
+    owner_id, text = row
+    if owner_id != current_user.id:
+        raise PermissionDeniedError("You don't have access to this document")
+    text = text or ""
+    
+    async def _slices():
+        for start in range(0, len(text), TEXT_STREAM_SLICE_CHARS):
+            yield text[start:start + TEXT_STREAM_SLICE_CHARS]
+    
+    return StreamingResponse(_slices(), media_type="text/plain; charset=utf-8")
+
+
 @router.get("/{document_id}", response_model=DocumentDetailResponse)
 async def get_document(
     document_id: UUID,
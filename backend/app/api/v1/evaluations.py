@@ -16,11 +16,11 @@ from app.schemas import (
     EvaluationListResponse,
     EvaluationResponse,
     EvaluationResultListResponse,
-    EvaluationResultResponse,
     PaginationParams,
     SuccessResponse,
     paginate,
 )
+from app.schemas.evaluation import EVALUATION_LIST_ADAPTER, EVALUATION_RESULT_LIST_ADAPTER
 
 logger = get_logger(__name__)
 
@@ -114,7 +114,7 @@ async def list_evaluations(
     evaluations = result.scalars().all()
     
     return paginate(
-        items=[EvaluationResponse.model_validate(e) for e in evaluations],
+        items=EVALUATION_LIST_ADAPTER.validate_python(evaluations, from_attributes=True),
         total=total,
         params=params,
     )
@@ -138,6 +138,7 @@ async def get_evaluation_results(
     current_user: CurrentUser,
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=50, ge=1, le=100),
+    chunk_id: UUID | None = Query(default=None, description="Only results that retrieved this chunk"),
 ) -> EvaluationResultListResponse:
     """Get individual query results for an evaluation."""
     # Verify ownership
@@ -145,14 +146,17 @@ async def get_evaluation_results(
     
     params = PaginationParams(page=page, per_page=per_page)
     
-    count_query = select(func.count(EvaluationResult.id)).where(
-        EvaluationResult.evaluation_id == evaluation_id
-    )
+    filters = [EvaluationResult.evaluation_id == evaluation_id]
+    if chunk_id:
+        # Array containment (@>) so the planner can use idx_evalres_chunks_gin
+        filters.append(EvaluationResult.retrieved_chunk_ids.contains([chunk_id]))
+    
+    count_query = select(func.count(EvaluationResult.id)).where(*filters)
     total = (await db.execute(count_query)).scalar() or 0
     
     query = (
         select(EvaluationResult)
-        .where(EvaluationResult.evaluation_id == evaluation_id)
+        .where(*filters)
         .order_by(EvaluationResult.created_at)
         .offset(params.offset)
         .limit(params.per_page)
@@ -161,7 +165,7 @@ async def get_evaluation_results(
     results = result.scalars().all()
     
     return paginate(
-        items=[EvaluationResultResponse.model_validate(r) for r in results],
+        items=EVALUATION_RESULT_LIST_ADAPTER.validate_python(results, from_attributes=True),
         total=total,
         params=params,
     )
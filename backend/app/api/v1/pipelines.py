@@ -5,7 +5,7 @@ CRUD operations for RAG pipelines
 from uuid import UUID
 
 from fastapi import APIRouter, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 
 from app.core.errors import BadRequestError, NotFoundError, PermissionDeniedError
 from app.core.logging import get_logger
@@ -26,6 +26,7 @@ from app.schemas.execution import (
     PipelineExecuteResponse,
 )
 from app.schemas.common import PaginatedResponse
+from app.schemas.pipeline import PIPELINE_LIST_ADAPTER
 
 logger = get_logger(__name__)
 
@@ -41,20 +42,24 @@ async def list_pipelines(
     current_user: CurrentUser,
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
+    node_type: str | None = Query(default=None, description="Only pipelines containing a node of this type"),
 ) -> PipelineListResponse:
     """List all pipelines for the current user."""
     params = PaginationParams(page=page, per_page=per_page)
     
+    filters = [Pipeline.user_id == current_user.id]
+    if node_type:
+        # nodes @> '[{"type": ...}]' is served by idx_pipelines_nodes_gin
+        filters.append(Pipeline.nodes.contains([{"type": node_type}]))
+    
     # Count total
-    count_query = select(func.count(Pipeline.id)).where(
-        Pipeline.user_id == current_user.id
-    )
+    count_query = select(func.count(Pipeline.id)).where(*filters)
     total = (await db.execute(count_query)).scalar() or 0
     
     # Fetch items
     query = (
         select(Pipeline)
-        .where(Pipeline.user_id == current_user.id)
+        .where(*filters)
         .order_by(Pipeline.updated_at.desc())
         .offset(params.offset)
         .limit(params.per_page)
@@ -63,7 +68,7 @@ async def list_pipelines(
     pipelines = result.scalars().all()
     
     return paginate(
-        items=[PipelineResponse.model_validate(p) for p in pipelines],
+        items=PIPELINE_LIST_ADAPTER.validate_python(pipelines, from_attributes=True),
         total=total,
         params=params,
     )
@@ -267,7 +272,7 @@ async def list_pipeline_executions(
 async def _get_user_pipeline(db: DbSession, pipeline_id: UUID, user_id: UUID) -> Pipeline:
     """Helper to get a pipeline and verify ownership."""
     result = await db.execute(
-        select(Pipeline).where(Pipeline.id == pipeline_id)
+        lambda_stmt(lambda: select(Pipeline).where(Pipeline.id == pipeline_id))
     )
     pipeline = result.scalar_one_or_none()
     
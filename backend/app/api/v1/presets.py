@@ -28,11 +28,14 @@ async def initialize_presets(
 @router.get("", response_model=List[dict])
 async def get_presets(
     category: Optional[str] = Query(None, description="Filter presets by category"),
+    tag: Optional[str] = Query(None, description="Filter presets by tag"),
+    chunking_method: Optional[str] = Query(None, description="Filter presets by chunking method"),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """List all available presets."""
-    presets = await preset_service.get_all_presets(db, category)
+    await preset_service.ready_event.wait()
+    presets = await preset_service.get_all_presets(db, category, tag, chunking_method)
     return [
         {
             "id": str(p.id),
@@ -54,6 +57,7 @@ async def get_preset_details(
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Get full details of a specific preset."""
+    await preset_service.ready_event.wait()
     preset = await preset_service.get_preset_by_id(db, preset_id)
     if not preset:
         raise HTTPException(status_code=404, detail="Preset not found")
@@ -82,6 +86,7 @@ async def apply_preset(
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Create a new pipeline from a preset, with optional config override and document association."""
+    await preset_service.ready_event.wait()
     try:
         # Resolve 'default' keyword
         resolved_id = None
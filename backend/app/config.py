@@ -37,6 +37,19 @@ class Settings(BaseSettings):
     db_pool_size: int = 5
     db_max_overflow: int = 10
     
+    # pgvector HNSW search breadth (candidate list size per ANN query)
+    hnsw_ef_search: int = 100
+    # Below this fraction of rows a filtered search skips ANN for an exact scan
+    vector_exact_scan_selectivity: float = 0.01
+    
+    # Semantic chunker encoder: ONNX file inside the model repo (e.g. an int8
+    # quantized export); only used on CPU hosts with optimum installed
+    sbert_onnx_file: Optional[str] = None
+    # Where the document classifier's quantized ONNX export is cached
+    onnx_model_dir: str = "./models/onnx"
+    # On-disk caches (e.g. zero-shot classifications) when diskcache is installed
+    cache_dir: str = "./cache"
+    
     # Redis (for Celery and caching)
     redis_url: str = "redis://localhost:6379/0"
     
@@ -1,34 +1,93 @@
 """
 Core module exports
+
+Re-exports are resolved lazily (PEP 562) so importing one name from
+app.core does not pull in slowapi, jose, bcrypt and the async engine.
 """
-from app.core.database import async_session_maker, close_db, engine, get_db, init_db
-from app.core.errors import (
-    AlreadyExistsError,
-    AppException,
-    AuthenticationError,
-    BadRequestError,
-    DatabaseError,
-    ExternalServiceError,
-    InvalidCredentialsError,
-    NotFoundError,
-    PermissionDeniedError,
-    RateLimitExceededError,
-    TokenExpiredError,
-    ValidationError,
-)
-from app.core.logging import configure_logging, get_logger
-from app.core.middleware import configure_middleware
-from app.core.rate_limit import limiter
-from app.core.security import (
-    TokenPair,
-    TokenPayload,
-    create_access_token,
-    create_refresh_token,
-    create_token_pair,
-    decode_token,
-    hash_password,
-    verify_password,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.core.database import async_session_maker, close_db, engine, get_db, init_db
+    from app.core.errors import (
+        AlreadyExistsError,
+        AppException,
+        AuthenticationError,
+        BadRequestError,
+        DatabaseError,
+        ExternalServiceError,
+        InvalidCredentialsError,
+        NotFoundError,
+        PermissionDeniedError,
+        RateLimitExceededError,
+        TokenExpiredError,
+        ValidationError,
+    )
+    from app.core.logging import configure_logging, get_logger
+    from app.core.middleware import configure_middleware
+    from app.core.rate_limit import limiter
+    from app.core.security import (
+        TokenPair,
+        TokenPayload,
+        create_access_token,
+        create_refresh_token,
+        create_token_pair,
+        decode_token,
+        hash_password,
+        verify_password,
+    )
+
+_EXPORTS = {
+    # Database
+    "engine": "app.core.database",
+    "async_session_maker": "app.core.database",
+    "get_db": "app.core.database",
+    "init_db": "app.core.database",
+    "close_db": "app.core.database",
+    # Errors
+    "AppException": "app.core.errors",
+    "AuthenticationError": "app.core.errors",
+    "InvalidCredentialsError": "app.core.errors",
+    "TokenExpiredError": "app.core.errors",
+    "PermissionDeniedError": "app.core.errors",
+    "NotFoundError": "app.core.errors",
+    "AlreadyExistsError": "app.core.errors",
+    "ValidationError": "app.core.errors",
+    "BadRequestError": "app.core.errors",
+    "RateLimitExceededError": "app.core.errors",
+    "ExternalServiceError": "app.core.errors",
+    "DatabaseError": "app.core.errors",
+    # Logging
+    "configure_logging": "app.core.logging",
+    "get_logger": "app.core.logging",
+    # Middleware
+    "configure_middleware": "app.core.middleware",
+    # Rate limiting
+    "limiter": "app.core.rate_limit",
+    # Security
+    "hash_password": "app.core.security",
+    "verify_password": "app.core.security",
+    "create_access_token": "app.core.security",
+    "create_refresh_token": "app.core.security",
+    "create_token_pair": "app.core.security",
+    "decode_token": "app.core.security",
+    "TokenPayload": "app.core.security",
+    "TokenPair": "app.core.security",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     # Database
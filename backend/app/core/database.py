@@ -3,8 +3,9 @@ Database Connection and Session Management
 Async SQLAlchemy setup for PostgreSQL
 """
 import ssl
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -39,10 +40,23 @@ ssl_context = ssl.create_default_context()
 ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (drivers expect str)."""
+    # OPT_NON_STR_KEYS accepts int keys like stdlib json and also UUID keys,
+    # which stdlib rejects; OPT_SERIALIZE_NUMPY covers scores and vectors
+    # computed with numpy
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
 # Engine configuration
 engine_kwargs = {
     "echo": settings.debug,
     "future": True,
+    # chunk metadata, pipeline nodes and preset configs round-trip as JSONB
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
 }
 
 # Only add pooling parameters for non-sqlite databases
@@ -89,9 +103,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 from app.models import Base
 
 async def init_db() -> None:
-    """Initialize database connection (call on startup)."""
+    """
+    Initialize database connection (call on startup).
+
+    Schema is owned by Alembic; create_all only runs for debug/test setups.
+    Elsewhere a single round trip confirms connectivity.
+    """
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        if settings.debug or settings.environment == "test":
+            await conn.run_sync(Base.metadata.create_all)
+        else:
+            await conn.execute(text("SELECT 1"))
 
 
 async def close_db() -> None:
@@ -2,12 +2,25 @@
 Custom Exception Classes for ChunkScope
 Provides consistent error handling across the application
 """
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Optional
+
+import orjson
+
+
+@lru_cache(maxsize=256)
+def _render_fixed_body(message: str, code: str) -> bytes:
+    """Serialize a detail-less error payload once per (message, code)."""
+    return orjson.dumps({"error": message, "code": code, "details": {}})
 
 
 class AppException(Exception):
     """Base exception for all application errors."""
     
+    # Subclasses whose payload never varies per request (fixed messages,
+    # no details) opt in to reusing their serialized body.
+    cache_body: ClassVar[bool] = False
+    
     def __init__(
         self,
         message: str,
@@ -20,6 +33,16 @@ class AppException(Exception):
         self.code = code
         self.details = details or {}
         super().__init__(self.message)
+    
+    def to_json(self) -> bytes:
+        """Serialize the error payload for an HTTP response."""
+        if self.cache_body and not self.details:
+            return _render_fixed_body(self.message, self.code)
+        return orjson.dumps({
+            "error": self.message,
+            "code": self.code,
+            "details": self.details,
+        })
 
 
 # ============================================
@@ -29,6 +52,8 @@ class AppException(Exception):
 class AuthenticationError(AppException):
     """User is not authenticated."""
     
+    cache_body = True
+    
     def __init__(self, message: str = "Authentication required"):
         super().__init__(
             message=message,
@@ -40,6 +65,8 @@ class AuthenticationError(AppException):
 class InvalidCredentialsError(AppException):
     """Invalid username or password."""
     
+    cache_body = True
+    
     def __init__(self, message: str = "Invalid email or password"):
         super().__init__(
             message=message,
@@ -51,6 +78,8 @@ class InvalidCredentialsError(AppException):
 class TokenExpiredError(AppException):
     """JWT token has expired."""
     
+    cache_body = True
+    
     def __init__(self, message: str = "Token has expired"):
         super().__init__(
             message=message,
@@ -62,6 +91,8 @@ class TokenExpiredError(AppException):
 class PermissionDeniedError(AppException):
     """User lacks permission for this action."""
     
+    cache_body = True
+    
     def __init__(self, message: str = "Permission denied"):
         super().__init__(
             message=message,
@@ -166,6 +197,8 @@ class ExternalServiceError(AppException):
 class DatabaseError(AppException):
     """Database operation failed."""
     
+    cache_body = True
+    
     def __init__(self, message: str = "Database error"):
         super().__init__(
             message=message,
@@ -0,0 +1,15 @@
+"""
+Hardware Detection
+CPU feature checks used to pick model quantization settings
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def cpu_has_vnni() -> bool:
+    """Whether the CPU advertises AVX-512 VNNI (int8 dot-product) support."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            return "avx512_vnni" in f.read()
+    except OSError:
+        return False
@@ -2,21 +2,85 @@
 Rate Limiting with SlowAPI
 Uses Redis if available, falls back to in-memory storage
 """
+import time
+from functools import lru_cache
+
+import orjson
 from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from starlette.requests import Request
+from starlette.responses import Response
 
 from app.config import settings
 
 
+@lru_cache(maxsize=32)
+def _rate_limited_body(limit: str) -> bytes:
+    """429 body for a limit string; there are only a handful, so each is serialized once."""
+    return orjson.dumps({
+        "error": f"Rate limit exceeded: {limit}",
+        "code": "RATE_LIMIT_EXCEEDED",
+        "details": {"limit": limit},
+    })
+
+
 def get_user_id_or_ip(request) -> str:
     """
     Rate limit key function.
     Uses user_id if authenticated, otherwise IP address.
+    
+    The key is cached on request.state so stacked limits on one route
+    resolve it only once.
     """
+    state = request.state
+    key = getattr(state, "rl_key", None)
+    if key is not None:
+        return key
+    
     # Check if user is authenticated
-    if hasattr(request.state, "user") and request.state.user:
-        return f"user:{request.state.user.id}"
-    return f"ip:{get_remote_address(request)}"
+    user = getattr(state, "user", None)
+    if user:
+        key = f"user:{user.id}"
+    else:
+        key = f"ip:{get_remote_address(request)}"
+    state.rl_key = key
+    return key
+
+
+def _rate_limit_headers(request: Request) -> dict[str, str]:
+    """
+    Retry-After / X-RateLimit-* for the limit that was hit.
+    
+    Computed here rather than via Limiter(headers_enabled=True), which would
+    require a response parameter on every @limiter.limit route.
+    """
+    current_limit = getattr(request.state, "view_rate_limit", None)
+    if current_limit is None:
+        return {}
+    limit, args = current_limit
+    try:
+        reset_at, remaining = request.app.state.limiter.limiter.get_window_stats(limit, *args)
+    except Exception:
+        # Storage unreachable: still answer 429, just without the headers
+        return {}
+    reset_in = 1 + reset_at
+    return {
+        "X-RateLimit-Limit": str(limit.amount),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset_in),
+        "Retry-After": str(max(0, int(reset_in - time.time()))),
+    }
+
+
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Response:
+    """Return the cached 429 body with Retry-After / X-RateLimit-* headers."""
+    return Response(
+        content=_rate_limited_body(exc.detail),
+        status_code=429,
+        media_type="application/json",
+        headers=_rate_limit_headers(request),
+    )
 
 
 def _create_limiter() -> Limiter:
@@ -0,0 +1,17 @@
+"""
+Response Classes
+orjson-backed JSON rendering used as the app-wide default
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of stdlib json."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
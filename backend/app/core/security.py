@@ -2,10 +2,9 @@
 JWT Authentication and Password Security
 """
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from app.config import settings
@@ -15,8 +14,13 @@ from app.core.errors import AuthenticationError, TokenExpiredError
 import bcrypt
 
 
-class TokenPayload(BaseModel):
-    """JWT token payload structure."""
+class TokenPayload(NamedTuple):
+    """
+    JWT token payload structure.
+    
+    A plain NamedTuple: jose has already verified signature and expiry,
+    so decode_token needs no further validation on the per-request path.
+    """
     sub: str  # Subject (user_id)
     exp: datetime  # Expiration
     type: str = "access"  # "access" or "refresh"
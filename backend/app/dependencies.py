@@ -8,7 +8,7 @@ from uuid import UUID
 from fastapi import Depends, Header
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 
 from app.core.database import get_db
 from app.core.errors import AuthenticationError, NotFoundError
@@ -39,7 +39,7 @@ async def get_current_user_optional(
     
     # Fetch user from database
     result = await db.execute(
-        select(User).where(User.id == user_id)
+        lambda_stmt(lambda: select(User).where(User.id == user_id))
     )
     return result.scalar_one_or_none()
 
@@ -60,7 +60,7 @@ async def get_current_user(
     
     # Fetch user from database
     result = await db.execute(
-        select(User).where(User.id == user_id)
+        lambda_stmt(lambda: select(User).where(User.id == user_id))
     )
     user = result.scalar_one_or_none()
     
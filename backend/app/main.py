@@ -10,6 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from app.api import api_router
 from app.config import settings
 from app.core import close_db, configure_logging, configure_middleware, init_db
+from app.core.responses import ORJSONResponse
 
 
 @asynccontextmanager
@@ -19,14 +20,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     configure_logging()
     await init_db()
     
-    # Seed builtin presets
-    from app.core.database import async_session_maker
+    # Seed builtin presets in the background so startup isn't blocked on it
     from app.services.preset_service import preset_service
-    async with async_session_maker() as db:
-        await preset_service.load_builtin_presets(db)
+    seed_task = preset_service.start_background_load()
+    
+    # Load the document classifier off the request path so the first
+    # analysis does not pay for the model load
+    from app.services.document_analyzer import document_analyzer
+    warm_task = document_analyzer.start_background_warmup()
         
     yield
     # Shutdown
+    for task in (seed_task, warm_task):
+        if not task.done():
+            task.cancel()
     await close_db()
 
 
@@ -40,6 +47,7 @@ def create_app() -> FastAPI:
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Configure middleware (CORS, error handling, logging)
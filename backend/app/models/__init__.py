@@ -8,6 +8,7 @@ from .models import (
     PipelineVersion,
     Document,
     Chunk,
+    ChunkEmbedding,
     TestDataset,
     Evaluation,
     EvaluationResult,
@@ -30,6 +31,7 @@ __all__ = [
     "PipelineVersion",
     "Document",
     "Chunk",
+    "ChunkEmbedding",
     "TestDataset",
     "Evaluation",
     "EvaluationResult",
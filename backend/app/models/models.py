@@ -7,17 +7,24 @@ from enum import Enum as PyEnum
 from typing import Any, Optional
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import (
+    DDL,
     BigInteger,
     Boolean,
+    Computed,
     Enum,
+    Float,
     ForeignKey,
+    ForeignKeyConstraint,
+    Index,
     Integer,
-    Numeric,
     String,
     Text,
     Uuid,
+    event,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -141,6 +148,21 @@ class Pipeline(Base, TimestampMixin):
         primaryjoin="Pipeline.id == foreign(Evaluation.pipeline_id)"
     )
     execution_logs: Mapped[list["ExecutionLog"]] = relationship(back_populates="pipeline", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        Index(
+            "idx_pipelines_active",
+            "updated_at",
+            postgresql_where=text("status IN ('draft', 'running')"),
+        ),
+        # Serves node-type containment lookups: nodes @> '[{"type": ...}]'
+        Index(
+            "idx_pipelines_nodes_gin",
+            "nodes",
+            postgresql_using="gin",
+            postgresql_ops={"nodes": "jsonb_path_ops"},
+        ),
+    )
 
 
 class PipelineVersion(Base):
@@ -156,7 +178,7 @@ class PipelineVersion(Base):
     )
     version_number: Mapped[int] = mapped_column(Integer, nullable=False)
     config: Mapped[dict] = mapped_column(JSONB, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     
     # Unique constraint on (pipeline_id, version_number)
     __table_args__ = (
@@ -184,6 +206,8 @@ class Document(Base, TimestampMixin):
     file_path: Mapped[str] = mapped_column(String(512), nullable=False)
     file_type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     file_size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger)
+    # blake2b-128 of the uploaded bytes, for duplicate detection
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32))
     
     # JSONB for variable metadata (page_count, author, etc.)
     doc_metadata: Mapped[dict] = mapped_column('metadata', JSONB, default=dict, server_default="{}")
@@ -196,18 +220,34 @@ class Document(Base, TimestampMixin):
     # Relationships
     user: Mapped["User"] = relationship(back_populates="documents")
     chunks: Mapped[list["Chunk"]] = relationship(back_populates="document", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        Index(
+            "idx_documents_unprocessed",
+            "created_at",
+            postgresql_where=text("is_processed = false"),
+        ),
+        Index("idx_documents_user_content_hash", "user_id", "content_hash"),
+        Index(
+            "idx_documents_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
 
 
 class Chunk(Base):
-    """Text chunks with vector embeddings."""
+    """Text chunks. Embeddings live in ChunkEmbedding."""
     
     __tablename__ = "chunks"
     
+    # Part of the primary key: chunks is hash-partitioned on document_id,
+    # and PostgreSQL requires the partition key in every unique constraint.
     document_id: Mapped[UUID] = mapped_column(
         Uuid,
         ForeignKey("documents.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        primary_key=True,
     )
     pipeline_version_id: Mapped[Optional[UUID]] = mapped_column(
         Uuid,
@@ -218,12 +258,17 @@ class Chunk(Base):
     text: Mapped[str] = mapped_column(Text, nullable=False)
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
     
-    # Vector embedding (1536 for OpenAI text-embedding-3-small/large)
-    embedding = mapped_column(Vector(1536))
-    
-    # Chunking configuration
+    # Chunking configuration. VARCHAR + CHECK rather than a PG enum type:
+    # ChunkingMethod grows often and CHECK changes are transactional.
     chunking_method: Mapped[Optional[ChunkingMethod]] = mapped_column(
-        Enum(ChunkingMethod, name='chunking_method', values_callable=get_enum_values)
+        Enum(
+            ChunkingMethod,
+            name='chunking_method',
+            values_callable=get_enum_values,
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+        )
     )
     chunk_size: Mapped[Optional[int]] = mapped_column(Integer)
     chunk_overlap: Mapped[Optional[int]] = mapped_column(Integer)
@@ -236,31 +281,119 @@ class Chunk(Base):
     # Token count for cost estimation
     token_count: Mapped[Optional[int]] = mapped_column(Integer)
     
-    # Parent-child relationship for context retrieval
-    parent_chunk_id: Mapped[Optional[UUID]] = mapped_column(
-        Uuid, 
-        ForeignKey("chunks.id", ondelete="SET NULL"),
-        index=True
-    )
+    # Parent-child relationship for context retrieval. Not a database FK:
+    # chunks.id alone is not unique across partitions. Parents always live
+    # in the same document, so document deletion still removes both.
+    parent_chunk_id: Mapped[Optional[UUID]] = mapped_column(Uuid, index=True)
     
-    # Full-text search vector
-    tsv = mapped_column(TSVECTOR)
+    # Full-text search vector, maintained by PostgreSQL from text
+    tsv = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(text, ''))", persisted=True),
+    )
     
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     
     # Relationships
     document: Mapped["Document"] = relationship(back_populates="chunks")
     pipeline_version: Mapped[Optional["PipelineVersion"]] = relationship(back_populates="chunks")
+    embedding_record: Mapped[Optional["ChunkEmbedding"]] = relationship(
+        back_populates="chunk",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
     
     # Self-referential relationship for parent-child
     parent: Mapped[Optional["Chunk"]] = relationship(
-        "Chunk", remote_side="Chunk.id", back_populates="children"
+        "Chunk",
+        primaryjoin="foreign(Chunk.parent_chunk_id) == Chunk.id",
+        remote_side="Chunk.id",
+        back_populates="children",
     )
     children: Mapped[list["Chunk"]] = relationship(
-        "Chunk", back_populates="parent", cascade="all, delete-orphan"
+        "Chunk",
+        primaryjoin="foreign(Chunk.parent_chunk_id) == Chunk.id",
+        back_populates="parent",
+        cascade="all, delete-orphan",
+    )
+    
+    __table_args__ = (
+        Index(
+            "idx_chunks_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        Index("idx_chunks_tsv", "tsv", postgresql_using="gin"),
+        # Ordered per-document listing; also serves plain document_id lookups
+        Index(
+            "idx_chunks_doc_idx_covering",
+            "document_id",
+            "chunk_index",
+            postgresql_include=["token_count", "chunk_size"],
+        ),
+        # Lookups by chunk id alone (GET /chunks/{id}, parent_chunk_id) cannot
+        # prune partitions and the (document_id, id) PK does not serve them
+        Index("ix_chunks_id", "id"),
+        # Partitions are created by the after_create hook below
+        {"postgresql_partition_by": "HASH (document_id)"},
+    )
+
+
+class ChunkEmbedding(Base):
+    """
+    Vector embedding for a chunk, kept out of the chunks heap.
+    
+    Text and metadata scans on chunks no longer drag 3 KB vectors through
+    the buffer cache; similarity queries join back to chunks only for the
+    rows they return.
+    """
+    
+    __tablename__ = "chunk_embeddings"
+    
+    # Keyed by chunk_id rather than the generic id column
+    id = None
+    chunk_id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    # Denormalized from chunks so filtered searches need no join and the
+    # FK can reference the partitioned (document_id, id) key
+    document_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
+    
+    # Vector embedding (1536 for OpenAI text-embedding-3-small/large),
+    # stored as FP16 halfvec to halve row, index and I/O size
+    embedding = mapped_column(HALFVEC(1536), nullable=False)
+    
+    chunk: Mapped["Chunk"] = relationship(back_populates="embedding_record")
+    
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["document_id", "chunk_id"],
+            ["chunks.document_id", "chunks.id"],
+            ondelete="CASCADE",
+        ),
+        # ANN index for cosine similarity search (see migration d7a1c3e9b5f2)
+        Index(
+            "idx_chunk_embeddings_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
     )
 
 
+CHUNK_PARTITIONS = 16
+
+event.listen(
+    Chunk.__table__,
+    "after_create",
+    DDL(";".join(
+        f"CREATE TABLE IF NOT EXISTS chunks_p{i} PARTITION OF chunks "
+        f"FOR VALUES WITH (MODULUS {CHUNK_PARTITIONS}, REMAINDER {i})"
+        for i in range(CHUNK_PARTITIONS)
+    )).execute_if(dialect="postgresql"),
+)
+
+
 class TestDataset(Base, TimestampMixin):
     """Golden Q&A pairs for evaluation."""
     __test__ = False
@@ -324,7 +457,6 @@ class Evaluation(Base):
     status: Mapped[EvaluationStatus] = mapped_column(
         Enum(EvaluationStatus, name='evaluation_status', values_callable=get_enum_values),
         default=EvaluationStatus.PENDING,
-        index=True
     )
     
     # Aggregate scores
@@ -334,11 +466,11 @@ class Evaluation(Base):
     total_queries: Mapped[int] = mapped_column(Integer, default=0)
     completed_queries: Mapped[int] = mapped_column(Integer, default=0)
     total_latency_ms: Mapped[int] = mapped_column(BigInteger, default=0)
-    total_cost_usd: Mapped[float] = mapped_column(Numeric(10, 6), default=0)
+    total_cost_usd: Mapped[float] = mapped_column(Float, default=0)
     
     started_at: Mapped[Optional[datetime]] = mapped_column()
     completed_at: Mapped[Optional[datetime]] = mapped_column()
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     
     # Relationships
     user: Mapped["User"] = relationship(back_populates="evaluations")
@@ -351,6 +483,15 @@ class Evaluation(Base):
     )
     test_dataset: Mapped[Optional["TestDataset"]] = relationship(back_populates="evaluations")
     results: Mapped[list["EvaluationResult"]] = relationship(back_populates="evaluation", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Most rows are completed; index only the pending/running working set
+        Index(
+            "idx_evaluations_active",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
 
 
 class EvaluationResult(Base):
@@ -380,12 +521,21 @@ class EvaluationResult(Base):
     
     # Performance metrics
     latency_ms: Mapped[Optional[int]] = mapped_column(Integer)
-    cost_usd: Mapped[Optional[float]] = mapped_column(Numeric(10, 6))
+    cost_usd: Mapped[Optional[float]] = mapped_column(Float)
     
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     
     # Relationships
     evaluation: Mapped["Evaluation"] = relationship(back_populates="results")
+    
+    __table_args__ = (
+        # Reverse lookups: which results retrieved a given chunk
+        Index(
+            "idx_evalres_chunks_gin",
+            "retrieved_chunk_ids",
+            postgresql_using="gin",
+        ),
+    )
 
 
 class ExecutionLog(Base):
@@ -415,10 +565,19 @@ class ExecutionLog(Base):
     # Additional context
     details: Mapped[dict] = mapped_column(JSONB, default=dict, server_default="{}")
     
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, index=True)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), index=True)
     
     # Relationships
     pipeline: Mapped["Pipeline"] = relationship(back_populates="execution_logs")
+    
+    __table_args__ = (
+        Index(
+            "idx_execution_logs_details_gin",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+    )
 
 
 class Preset(Base, TimestampMixin):
@@ -452,3 +611,31 @@ class Preset(Base, TimestampMixin):
     
     # Relationships
     creator: Mapped[Optional["User"]] = relationship()
+    
+    # jsonb_path_ops GIN indexes back containment (@>) filters on the arrays
+    __table_args__ = (
+        Index(
+            "idx_presets_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_presets_use_cases_gin",
+            "use_cases",
+            postgresql_using="gin",
+            postgresql_ops={"use_cases": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_presets_document_types_gin",
+            "document_types",
+            postgresql_using="gin",
+            postgresql_ops={"document_types": "jsonb_path_ops"},
+        ),
+        # Expression index for configuration -> 'chunking' @> {...} lookups
+        Index(
+            "idx_presets_config_chunking_gin",
+            text("(configuration -> 'chunking') jsonb_path_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
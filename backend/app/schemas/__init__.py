@@ -1,66 +1,143 @@
 """
 Schemas package exports
+
+Re-exports are resolved lazily (PEP 562) so importing one schema does not
+load every schema module and its validators.
 """
-from app.schemas.auth import (
-    AuthResponse,
-    LoginRequest,
-    RefreshTokenRequest,
-    RegisterRequest,
-    TokenResponse,
-    UserResponse,
-)
-from app.schemas.chunk import (
-    BoundingBox,
-    ChunkingConfig,
-    ChunkMetrics,
-    ChunkVisualization,
-    ChunkVisualizeRequest,
-    ChunkVisualizeResponse,
-)
-from app.schemas.common import (
-    BaseSchema,
-    ErrorResponse,
-    HealthResponse,
-    IDMixin,
-    PaginatedResponse,
-    PaginationParams,
-    SuccessResponse,
-    TimestampMixin,
-    paginate,
-)
-from app.schemas.config import (
-    DocumentAnalyzeRequest,
-    DocumentAnalyzeResponse,
-    DocumentCharacteristics,
-    PipelineRecommendation,
-    PipelineValidateRequest,
-    PipelineValidateResponse,
-    ValidationIssue,
-)
-from app.schemas.document import (
-    ChunkListResponse,
-    ChunkResponse,
-    ChunkWithSimilarity,
-    DocumentCreate,
-    DocumentListResponse,
-    DocumentResponse,
-    DocumentDetailResponse,
-)
-from app.schemas.evaluation import (
-    EvaluationCreate,
-    EvaluationListResponse,
-    EvaluationResponse,
-    EvaluationResultListResponse,
-    EvaluationResultResponse,
-)
-from app.schemas.pipeline import (
-    PipelineCreate,
-    PipelineEdge,
-    PipelineListResponse,
-    PipelineNode,
-    PipelineResponse,
-    PipelineUpdate,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.schemas.auth import (
+        AuthResponse,
+        LoginRequest,
+        RefreshTokenRequest,
+        RegisterRequest,
+        TokenResponse,
+        UserResponse,
+    )
+    from app.schemas.chunk import (
+        BoundingBox,
+        ChunkingConfig,
+        ChunkMetrics,
+        ChunkVisualization,
+        ChunkVisualizeRequest,
+        ChunkVisualizeResponse,
+    )
+    from app.schemas.common import (
+        BaseSchema,
+        ErrorResponse,
+        HealthResponse,
+        IDMixin,
+        PaginatedResponse,
+        PaginationParams,
+        SuccessResponse,
+        TimestampMixin,
+        paginate,
+    )
+    from app.schemas.config import (
+        DocumentAnalyzeRequest,
+        DocumentAnalyzeResponse,
+        DocumentCharacteristics,
+        PipelineRecommendation,
+        PipelineValidateRequest,
+        PipelineValidateResponse,
+        ValidationIssue,
+    )
+    from app.schemas.document import (
+        ChunkListResponse,
+        ChunkResponse,
+        ChunkWithSimilarity,
+        DocumentCreate,
+        DocumentListResponse,
+        DocumentResponse,
+        DocumentDetailResponse,
+    )
+    from app.schemas.evaluation import (
+        EvaluationCreate,
+        EvaluationListResponse,
+        EvaluationResponse,
+        EvaluationResultListResponse,
+        EvaluationResultResponse,
+    )
+    from app.schemas.pipeline import (
+        PipelineCreate,
+        PipelineEdge,
+        PipelineListResponse,
+        PipelineNode,
+        PipelineResponse,
+        PipelineUpdate,
+    )
+
+_EXPORTS = {
+    # Common
+    "BaseSchema": "app.schemas.common",
+    "IDMixin": "app.schemas.common",
+    "TimestampMixin": "app.schemas.common",
+    "PaginationParams": "app.schemas.common",
+    "PaginatedResponse": "app.schemas.common",
+    "paginate": "app.schemas.common",
+    "SuccessResponse": "app.schemas.common",
+    "ErrorResponse": "app.schemas.common",
+    "HealthResponse": "app.schemas.common",
+    # Auth
+    "RegisterRequest": "app.schemas.auth",
+    "LoginRequest": "app.schemas.auth",
+    "RefreshTokenRequest": "app.schemas.auth",
+    "TokenResponse": "app.schemas.auth",
+    "UserResponse": "app.schemas.auth",
+    "AuthResponse": "app.schemas.auth",
+    # Pipeline
+    "PipelineNode": "app.schemas.pipeline",
+    "PipelineEdge": "app.schemas.pipeline",
+    "PipelineCreate": "app.schemas.pipeline",
+    "PipelineUpdate": "app.schemas.pipeline",
+    "PipelineResponse": "app.schemas.pipeline",
+    "PipelineListResponse": "app.schemas.pipeline",
+    # Document
+    "DocumentCreate": "app.schemas.document",
+    "DocumentResponse": "app.schemas.document",
+    "DocumentDetailResponse": "app.schemas.document",
+    "DocumentListResponse": "app.schemas.document",
+    "ChunkResponse": "app.schemas.document",
+    "ChunkListResponse": "app.schemas.document",
+    "ChunkWithSimilarity": "app.schemas.document",
+    # Chunk Visualization
+    "ChunkingConfig": "app.schemas.chunk",
+    "BoundingBox": "app.schemas.chunk",
+    "ChunkVisualization": "app.schemas.chunk",
+    "ChunkMetrics": "app.schemas.chunk",
+    "ChunkVisualizeRequest": "app.schemas.chunk",
+    "ChunkVisualizeResponse": "app.schemas.chunk",
+    # Evaluation
+    "EvaluationCreate": "app.schemas.evaluation",
+    "EvaluationResponse": "app.schemas.evaluation",
+    "EvaluationListResponse": "app.schemas.evaluation",
+    "EvaluationResultResponse": "app.schemas.evaluation",
+    "EvaluationResultListResponse": "app.schemas.evaluation",
+    # Config
+    "DocumentAnalyzeRequest": "app.schemas.config",
+    "DocumentAnalyzeResponse": "app.schemas.config",
+    "DocumentCharacteristics": "app.schemas.config",
+    "PipelineRecommendation": "app.schemas.config",
+    "PipelineValidateRequest": "app.schemas.config",
+    "PipelineValidateResponse": "app.schemas.config",
+    "ValidationIssue": "app.schemas.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     # Common
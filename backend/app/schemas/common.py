@@ -3,22 +3,33 @@ Common Pydantic Schemas
 Shared request/response models
 """
 from datetime import datetime
-from typing import Any, Generic, Optional, TypeVar
+from typing import Annotated, Any, Generic, Optional, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 
 
 # Generic type for pagination
 T = TypeVar("T")
 
+# Opaque JSON object passed through from our own JSONB columns to responses.
+# Validation is skipped (no per-key walk or dict copy); it still documents and
+# serializes as an object. Not for request bodies: user input stays validated.
+JSONBlob = Annotated[dict[str, Any], SkipValidation]
+
 
 class BaseSchema(BaseModel):
-    """Base schema with common configuration."""
+    """
+    Base schema for response models.
+    
+    Frozen: responses are built once from ORM rows and never mutated, so
+    use model_copy(update=...) to derive a changed instance.
+    """
     
     model_config = ConfigDict(
         from_attributes=True,  # Enable ORM mode
         populate_by_name=True,
+        frozen=True,
     )
 
 
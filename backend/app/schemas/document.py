@@ -6,9 +6,9 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.schemas.common import BaseSchema, IDMixin, PaginatedResponse, TimestampMixin
+from app.schemas.common import BaseSchema, IDMixin, JSONBlob, PaginatedResponse, TimestampMixin
 
 
 # ============================================
@@ -34,21 +34,15 @@ class DocumentResponse(BaseSchema, IDMixin, TimestampMixin):
     file_path: str
     file_type: str
     file_size_bytes: Optional[int]
-    doc_metadata: dict[str, Any] = Field(serialization_alias="metadata")
+    doc_metadata: JSONBlob = Field(serialization_alias="metadata")
     is_processed: bool
     chunk_count: int = 0
-    
-    class Config:
-        populate_by_name = True
 
 
 class DocumentDetailResponse(DocumentResponse):
     """Detailed document response with extracted text."""
     extracted_text: Optional[str]
 
-    class Config:
-        populate_by_name = True
-
 
 class DocumentListResponse(PaginatedResponse[DocumentResponse]):
     """Paginated list of documents."""
@@ -67,12 +61,9 @@ class ChunkResponse(BaseSchema, IDMixin):
     chunking_method: Optional[str]
     chunk_size: Optional[int]
     chunk_overlap: Optional[int]
-    chunk_metadata: dict[str, Any] = Field(serialization_alias="metadata")
+    chunk_metadata: JSONBlob = Field(serialization_alias="metadata")
     token_count: Optional[int]
     created_at: datetime
-    
-    class Config:
-        populate_by_name = True
 
 
 class ChunkListResponse(PaginatedResponse[ChunkResponse]):
@@ -80,6 +71,10 @@ class ChunkListResponse(PaginatedResponse[ChunkResponse]):
     pass
 
 
+# Validates a whole page of ORM rows in one pydantic-core call
+CHUNK_LIST_ADAPTER = TypeAdapter(list[ChunkResponse])
+
+
 class ChunkWithSimilarity(ChunkResponse):
     """Chunk with similarity score for search results."""
     similarity: float
@@ -6,9 +6,9 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.schemas.common import BaseSchema, IDMixin, PaginatedResponse
+from app.schemas.common import BaseSchema, IDMixin, JSONBlob, PaginatedResponse
 
 
 # ============================================
@@ -37,7 +37,7 @@ class EvaluationResponse(BaseSchema, IDMixin):
     pipeline_id: UUID
     test_dataset_id: Optional[UUID]
     status: str
-    aggregate_scores: dict[str, Any] = Field(default_factory=dict)
+    aggregate_scores: JSONBlob = Field(default_factory=dict)
     total_queries: int = 0
     completed_queries: int = 0
     total_latency_ms: int = 0
@@ -53,7 +53,7 @@ class EvaluationResultResponse(BaseSchema, IDMixin):
     query: str
     expected_answer: Optional[str]
     generated_answer: Optional[str]
-    scores: dict[str, Any] = Field(default_factory=dict)
+    scores: JSONBlob = Field(default_factory=dict)
     latency_ms: Optional[int]
     cost_usd: Optional[float]
     created_at: datetime
@@ -67,3 +67,8 @@ class EvaluationListResponse(PaginatedResponse[EvaluationResponse]):
 class EvaluationResultListResponse(PaginatedResponse[EvaluationResultResponse]):
     """Paginated list of evaluation results."""
     pass
+
+
+# Validate whole pages of ORM rows in one pydantic-core call
+EVALUATION_LIST_ADAPTER = TypeAdapter(list[EvaluationResponse])
+EVALUATION_RESULT_LIST_ADAPTER = TypeAdapter(list[EvaluationResultResponse])
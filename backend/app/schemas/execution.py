@@ -5,9 +5,9 @@ Request/response models for pipeline execution
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from app.schemas.common import BaseSchema, IDMixin
+from app.schemas.common import BaseSchema, IDMixin, JSONBlob
 
 
 # ============================================
@@ -16,10 +16,16 @@ from app.schemas.common import BaseSchema, IDMixin
 
 class ExecutionOptions(BaseModel):
     """Options for pipeline execution."""
+    model_config = ConfigDict(frozen=True)
+
     create_version: bool = Field(default=True, description="Create an immutable version snapshot")
     notify_websocket: bool = Field(default=True, description="Send progress updates via WebSocket")
 
 
+# Shared default (the model is frozen); avoids building options per request
+DEFAULT_EXECUTION_OPTIONS = ExecutionOptions()
+
+
 # ============================================
 # Request Schemas
 # ============================================
@@ -27,7 +33,7 @@ class ExecutionOptions(BaseModel):
 class PipelineExecuteRequest(BaseModel):
     """Request to execute a pipeline."""
     document_id: UUID
-    options: ExecutionOptions = Field(default_factory=ExecutionOptions)
+    options: ExecutionOptions = DEFAULT_EXECUTION_OPTIONS
 
 
 # ============================================
@@ -51,30 +57,33 @@ class ExecutionStatusResponse(BaseSchema, IDMixin):
     current_node: Optional[str] = None
     logs: list[dict[str, Any]] = Field(default_factory=list)
     error: Optional[str] = None
-    result: Optional[dict[str, Any]] = None
+    result: Optional[JSONBlob] = None
 
     @model_validator(mode="before")
     @classmethod
     def extract_from_details(cls, data: Any) -> Any:
         """Extract missing fields from 'details' if available."""
+        # Common case: no details to fall back on, nothing to probe
         if isinstance(data, dict):
-            details = data.get("details", {})
+            details = data.get("details")
+            if not details:
+                return data
             if "document_id" not in data and "document_id" in details:
                 data["document_id"] = details["document_id"]
             if "status" not in data and "status" in details:
                 data["status"] = details["status"]
-        else:
-            # Handle ORM objects
-            details = getattr(data, "details", {})
-            if details and isinstance(details, dict):
-                if not getattr(data, "document_id", None) and "document_id" in details:
-                    try:
-                        data.document_id = UUID(details["document_id"])
-                    except (AttributeError, ValueError, TypeError):
-                        pass
-                if not getattr(data, "status", None) and "status" in details:
-                    try:
-                        data.status = details["status"]
-                    except (AttributeError, ValueError, TypeError):
-                        pass
+            return data
+        
+        # Handle ORM objects
+        details = getattr(data, "details", None)
+        if not details or not isinstance(details, dict):
+            return data
+        try:
+            # status first: a malformed document_id must not block it
+            if "status" in details and not getattr(data, "status", None):
+                data.status = details["status"]
+            if "document_id" in details and not getattr(data, "document_id", None):
+                data.document_id = UUID(details["document_id"])
+        except (AttributeError, ValueError, TypeError):
+            pass
         return data
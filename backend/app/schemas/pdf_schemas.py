@@ -3,9 +3,49 @@ PDF Extraction Schemas
 Data models for PDF text extraction with character-level coordinates
 """
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, NamedTuple, Optional
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PrivateAttr,
+    computed_field,
+)
+
+
+class PDFModel(BaseModel):
+    """
+    Base for the PDF extraction models.
+    
+    Core schemas are built on first validation/serialization rather than at
+    import, so importing this module (and everything that imports the PDF
+    processor) doesn't pay for a dozen schema builds up front; the
+    model_construct fast path never needs them.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class TrustedModel(PDFModel):
+    """
+    Base for models built from trusted extractor output.
+    
+    ``fast()`` skips validation via ``model_construct``; callers pass nested
+    models already built with their own ``fast()``. User-supplied input must
+    still go through the normal validating constructor.
+    
+    Frozen: these are created by the hundred thousand per document and never
+    edited in place; derive changed copies with ``model_copy(update=...)``.
+    """
+    model_config = ConfigDict(frozen=True)
+    
+    @classmethod
+    def fast(cls, **fields: Any):
+        """Construct without validation (defaults still applied)."""
+        return cls.model_construct(**fields)
 
 
 class BlockType(str, Enum):
@@ -15,12 +55,21 @@ class BlockType(str, Enum):
     IMAGE = "image"
 
 
-class BoundingBox(BaseModel):
-    """Bounding box coordinates (PDF coordinate system)."""
-    x0: float = Field(description="Left edge x-coordinate")
-    y0: float = Field(description="Top edge y-coordinate")
-    x1: float = Field(description="Right edge x-coordinate")
-    y1: float = Field(description="Bottom edge y-coordinate")
+class BoundingBox(NamedTuple):
+    """
+    Bounding box coordinates (PDF coordinate system).
+    
+    A plain tuple rather than a model: one is created per block, line, span,
+    cell and heading, and four floats don't need validation.
+    
+    width/height/center are computed on access rather than stored, which
+    would add two slots to every instance; layout loops (column detection)
+    read x0..y1 directly instead.
+    """
+    x0: float  # Left edge x-coordinate
+    y0: float  # Top edge y-coordinate
+    x1: float  # Right edge x-coordinate
+    y1: float  # Bottom edge y-coordinate
     
     @property
     def width(self) -> float:
@@ -35,7 +84,26 @@ class BoundingBox(BaseModel):
         return ((self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2)
 
 
-class CharacterInfo(BaseModel):
+def _coerce_bbox(value: Any) -> Any:
+    if isinstance(value, dict):
+        return BoundingBox(**value)
+    return value
+
+
+def _bbox_as_dict(bbox: BoundingBox) -> dict[str, float]:
+    return {"x0": bbox[0], "y0": bbox[1], "x1": bbox[2], "y1": bbox[3]}
+
+
+# Model field type for bboxes: accepts a BoundingBox, 4-sequence or
+# {"x0", "y0", "x1", "y1"} dict, and serializes to that dict shape
+BBox = Annotated[
+    BoundingBox,
+    BeforeValidator(_coerce_bbox),
+    PlainSerializer(_bbox_as_dict),
+]
+
+
+class CharacterInfo(TrustedModel):
     """Character-level information with coordinates."""
     char: str = Field(description="The character")
     x: float = Field(description="X-coordinate (left edge)")
@@ -47,28 +115,61 @@ class CharacterInfo(BaseModel):
     color: Optional[int] = Field(default=None, description="Text color as integer")
 
 
-class TextSpan(BaseModel):
+# Column layout of TextSpan.char_array; color -1 means "no color". Float
+# columns are float64 so coordinates keep the precision PyMuPDF reported.
+CHAR_DTYPE = np.dtype([
+    ("char", "U1"),
+    ("x", "f8"),
+    ("y", "f8"),
+    ("w", "f8"),
+    ("h", "f8"),
+    ("size", "f8"),
+    ("color", "i4"),
+])
+
+
+class TextSpan(TrustedModel):
     """A span of text with consistent formatting."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     text: str
-    bbox: BoundingBox
+    bbox: BBox
     font: str = ""
     size: float = 0
     flags: int = 0  # Bold=1, Italic=2, etc.
     color: Optional[int] = None
-    characters: list[CharacterInfo] = Field(default_factory=list)
+    # Character-level coordinates as one structured array (CHAR_DTYPE) rather
+    # than a model per character; None unless extraction requested them.
+    # Serialized through the characters field below, not under its own key.
+    char_array: Optional[np.ndarray] = Field(default=None, exclude=True)
+    
+    @computed_field
+    @property
+    def characters(self) -> list[CharacterInfo]:
+        """CharacterInfo views over char_array (built on each access)."""
+        if self.char_array is None:
+            return []
+        font = self.font
+        return [
+            CharacterInfo.fast(
+                char=char, x=x, y=y, width=w, height=h, font=font, size=size,
+                color=None if color < 0 else color,
+            )
+            for char, x, y, w, h, size, color in self.char_array.tolist()
+        ]
 
 
-class TextLine(BaseModel):
+class TextLine(TrustedModel):
     """A line of text within a block."""
     text: str
-    bbox: BoundingBox
+    bbox: BBox
     spans: list[TextSpan] = Field(default_factory=list)
 
 
-class TextBlock(BaseModel):
+class TextBlock(TrustedModel):
     """A block of text (paragraph, heading, etc.)."""
     text: str
-    bbox: BoundingBox
+    bbox: BBox
     block_type: BlockType = BlockType.TEXT
     block_number: int = 0
     lines: list[TextLine] = Field(default_factory=list)
@@ -77,41 +178,49 @@ class TextBlock(BaseModel):
     column_index: Optional[int] = None
 
 
-class TableCell(BaseModel):
+class TableCell(PDFModel):
     """A cell within a table."""
+    model_config = ConfigDict(frozen=True)
+    
     text: str
     row: int
     col: int
-    bbox: BoundingBox
+    bbox: BBox
     rowspan: int = 1
     colspan: int = 1
 
 
-class TableData(BaseModel):
+class TableData(PDFModel):
     """Extracted table structure."""
-    bbox: BoundingBox
+    bbox: BBox
     rows: int
     cols: int
     cells: list[TableCell] = Field(default_factory=list)
     
     def to_list(self) -> list[list[str]]:
         """Convert to 2D list of strings."""
-        result = [["" for _ in range(self.cols)] for _ in range(self.rows)]
-        for cell in self.cells:
-            if 0 <= cell.row < self.rows and 0 <= cell.col < self.cols:
-                result[cell.row][cell.col] = cell.text
-        return result
+        grid = np.full((self.rows, self.cols), "", dtype=object)
+        n = len(self.cells)
+        if n:
+            # Scatter all cell texts in one assignment; out-of-range cells are
+            # masked off and later cells win on duplicate positions
+            rows = np.fromiter((c.row for c in self.cells), dtype=np.intp, count=n)
+            cols = np.fromiter((c.col for c in self.cells), dtype=np.intp, count=n)
+            texts = np.fromiter((c.text for c in self.cells), dtype=object, count=n)
+            mask = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+            grid[rows[mask], cols[mask]] = texts[mask]
+        return grid.tolist()
 
 
-class Heading(BaseModel):
+class Heading(PDFModel):
     """Detected heading/section."""
     text: str
     level: int = Field(ge=1, le=6, description="Heading level 1-6")
-    bbox: BoundingBox
+    bbox: BBox
     page_number: int
 
 
-class ExtractedPage(BaseModel):
+class ExtractedPage(TrustedModel):
     """Extraction results for a single page."""
     page_number: int = Field(ge=0, description="0-indexed page number")
     width: float
@@ -129,13 +238,16 @@ class ExtractedPage(BaseModel):
     @property
     def column_count(self) -> int:
         """Estimate number of columns on the page."""
-        if not self.blocks:
-            return 1
-        columns = set(b.column_index for b in self.blocks if b.column_index is not None)
-        return len(columns) if columns else 1
+        # Column indices are small ints: OR them into a bitmask and count bits
+        mask = 0
+        for block in self.blocks:
+            column = block.column_index
+            if column is not None:
+                mask |= 1 << column
+        return mask.bit_count() or 1
 
 
-class DocumentMetadata(BaseModel):
+class DocumentMetadata(PDFModel):
     """PDF document metadata."""
     title: Optional[str] = None
     author: Optional[str] = None
@@ -153,7 +265,7 @@ class DocumentMetadata(BaseModel):
     has_tables: bool = False
 
 
-class ExtractedDocument(BaseModel):
+class ExtractedDocument(PDFModel):
     """Complete document extraction result."""
     page_count: int
     metadata: DocumentMetadata
@@ -164,10 +276,34 @@ class ExtractedDocument(BaseModel):
     extraction_time_ms: Optional[int] = None
     file_hash: Optional[str] = None
     
+    _full_text_cache: Optional[str] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "pages":
+            self._full_text_cache = None
+    
     @property
     def full_text(self) -> str:
-        """Get all text from the document."""
-        return "\n\n".join(page.full_text for page in self.pages)
+        """
+        Get all text from the document.
+        
+        Blocks are joined with newlines and pages with blank lines, built as
+        one flat join and cached until pages is reassigned.
+        """
+        if self._full_text_cache is None:
+            parts: list[str] = []
+            for page in self.pages:
+                for block in page.blocks:
+                    parts.append(block.text)
+                    parts.append("\n")
+                if page.blocks:
+                    parts.pop()
+                parts.append("\n\n")
+            if parts:
+                parts.pop()
+            self._full_text_cache = "".join(parts)
+        return self._full_text_cache
     
     @property
     def total_blocks(self) -> int:
@@ -178,7 +314,7 @@ class ExtractedDocument(BaseModel):
         return sum(len(page.tables) for page in self.pages)
 
 
-class ExtractionOptions(BaseModel):
+class ExtractionOptions(PDFModel):
     """Options for PDF extraction."""
     extract_characters: bool = Field(
         default=False, 
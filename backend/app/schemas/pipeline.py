@@ -2,13 +2,14 @@
 Pipeline Schemas
 Request/response models for pipeline operations
 """
+import sys
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
-from app.schemas.common import BaseSchema, IDMixin, PaginatedResponse, TimestampMixin
+from app.schemas.common import BaseSchema, IDMixin, JSONBlob, PaginatedResponse, TimestampMixin
 
 
 # ============================================
@@ -21,6 +22,13 @@ class PipelineNode(BaseModel):
     type: str = Field(description="Node type: chunker, embedder, retriever, etc.")
     position: dict[str, float] = Field(default_factory=lambda: {"x": 0, "y": 0})
     config: dict[str, Any] = Field(default_factory=dict)
+    
+    @field_validator("type", mode="after")
+    @classmethod
+    def _intern_type(cls, value: str) -> str:
+        # A handful of type names repeat across every node of every pipeline;
+        # interning shares one string and makes == comparisons an identity hit
+        return sys.intern(value)
 
 
 class PipelineEdge(BaseModel):
@@ -66,9 +74,13 @@ class PipelineResponse(BaseSchema, IDMixin, TimestampMixin):
     status: str
     nodes: list[PipelineNode]
     edges: list[PipelineEdge]
-    settings: dict[str, Any]
+    settings: JSONBlob
 
 
 class PipelineListResponse(PaginatedResponse[PipelineResponse]):
     """Paginated list of pipelines."""
     pass
+
+
+# Validates a whole page of ORM rows in one pydantic-core call
+PIPELINE_LIST_ADAPTER = TypeAdapter(list[PipelineResponse])
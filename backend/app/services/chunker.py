@@ -3,7 +3,44 @@ Chunker Service
 Centralized logic for different text chunking strategies.
 """
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+# Code points matched by regex \s (str.isspace); Unicode has none above U+3000
+_WHITESPACE_CODEPOINTS = np.array(
+    [c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32
+)
+_SENTENCE_TERMINATORS = np.array([ord(c) for c in ".!?"], dtype=np.uint32)
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+class ChunkSpans(NamedTuple):
+    """
+    Chunks as offset pairs into one source string.
+    
+    Chunk i is text[starts[i]:ends[i]]. Nothing is sliced until to_dicts(),
+    so sizes and positions are available without copying any chunk text.
+    """
+    text: str
+    starts: np.ndarray
+    ends: np.ndarray
+    
+    @classmethod
+    def from_lists(cls, text: str, starts: List[int], ends: List[int]) -> "ChunkSpans":
+        return cls(text, np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64))
+    
+    def sizes(self) -> np.ndarray:
+        return self.ends - self.starts
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize the {"text", "start", "end"} dicts apply_chunking returns."""
+        text = self.text
+        return [
+            {"text": text[start:end], "start": start, "end": end}
+            for start, end in zip(self.starts.tolist(), self.ends.tolist())
+        ]
+
 
 def apply_chunking(
     text: str,
@@ -30,53 +67,92 @@ def apply_chunking(
         # Default to recursive
         return recursive_chunking(text, chunk_size, overlap)
 
+def fixed_size_spans(text: str, chunk_size: int, overlap: int) -> ChunkSpans:
+    """
+    Fixed-size chunk offsets with overlap.
+    
+    Every chunk starts one stride after the previous, so the count is known
+    up front and all offsets are computed in one allocation, no loop.
+    """
+    text_len = len(text)
+    if chunk_size <= 0: chunk_size = 512
+    # An overlap of chunk_size or more would never advance; treat it as none
+    stride = chunk_size - overlap if 0 < overlap < chunk_size else chunk_size
+    
+    if text_len == 0:
+        n_chunks = 0
+    else:
+        # Chunks that stop short of the end, plus the one that reaches it
+        n_chunks = -(-max(text_len - chunk_size, 0) // stride) + 1
+    
+    starts = np.arange(n_chunks, dtype=np.int64) * stride
+    ends = np.minimum(starts + chunk_size, text_len)
+    return ChunkSpans(text, starts, ends)
+
 def fixed_size_chunking(text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
     """Simple fixed-size chunking with overlap."""
-    chunks = []
-    start = 0
-    if chunk_size <= 0: chunk_size = 512
+    return fixed_size_spans(text, chunk_size, overlap).to_dicts()
+
+def _sentence_spans(text: str) -> Iterator[Tuple[int, int]]:
+    r"""
+    Yield (start, end) offsets of the sentences in text.
     
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
-        chunks.append({
-            "text": text[start:end],
-            "start": start,
-            "end": end,
-        })
-        if end >= len(text):
-            break
-        start = end - overlap if end < len(text) else len(text)
-        if start >= end: # Safety against infinite loop
-            start = end
+    Same boundaries as re.split(r'(?<=[.!?])\s+', text): a sentence ends at a
+    whitespace run that follows ., ! or ?, and the run itself is dropped.
+    Boundaries are found in one vectorized pass over the code points.
+    """
+    n = len(text)
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    is_space = np.isin(codepoints, _WHITESPACE_CODEPOINTS)
+    is_terminator = np.isin(codepoints, _SENTENCE_TERMINATORS)
     
-    return chunks
+    # Whitespace runs directly after a terminator, and where each run ends
+    run_starts = np.flatnonzero(is_terminator[:-1] & is_space[1:]) + 1
+    non_space = np.flatnonzero(~is_space)
+    next_non_space = np.searchsorted(non_space, run_starts)
+    run_ends = np.append(non_space, n)[next_non_space]
+    
+    start = 0
+    for run_start, run_end in zip(run_starts.tolist(), run_ends.tolist()):
+        yield start, run_start
+        start = run_end
+    yield start, n
+
 
 def sentence_chunking(text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
     """Chunk by sentences, respecting chunk_size limit."""
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = (text[start:end] for start, end in _sentence_spans(text))
     
+    # Pieces are joined only when a chunk is flushed; += on the accumulator
+    # would copy it for every sentence
     chunks = []
-    current_chunk = ""
+    current_pieces: List[str] = []
+    current_len = 0
     current_start = 0
     
     for sentence in sentences:
-        if len(current_chunk) + len(sentence) > chunk_size and current_chunk:
+        if current_len + len(sentence) > chunk_size and current_len:
+            current_chunk = "".join(current_pieces)
             chunks.append({
                 "text": current_chunk.strip(),
                 "start": current_start,
-                "end": current_start + len(current_chunk),
+                "end": current_start + current_len,
             })
             overlap_text = current_chunk[-overlap:] if overlap else ""
-            current_start = current_start + len(current_chunk) - len(overlap_text)
-            current_chunk = overlap_text
+            current_start = current_start + current_len - len(overlap_text)
+            current_pieces = [overlap_text]
+            current_len = len(overlap_text)
         
-        current_chunk += sentence + " "
+        current_pieces.append(sentence)
+        current_pieces.append(" ")
+        current_len += len(sentence) + 1
     
+    current_chunk = "".join(current_pieces)
     if current_chunk.strip():
         chunks.append({
             "text": current_chunk.strip(),
             "start": current_start,
-            "end": current_start + len(current_chunk),
+            "end": current_start + current_len,
         })
     
     return chunks
@@ -86,79 +162,96 @@ def paragraph_chunking(text: str, chunk_size: int) -> List[Dict[str, Any]]:
     paragraphs = text.split("\n\n")
     
     chunks = []
-    current_chunk = ""
+    current_pieces: List[str] = []
+    current_len = 0
     current_start = 0
     char_pos = 0
     
     for para in paragraphs:
-        if len(current_chunk) + len(para) > chunk_size and current_chunk:
+        if current_len + len(para) > chunk_size and current_len:
             chunks.append({
-                "text": current_chunk.strip(),
+                "text": "".join(current_pieces).strip(),
                 "start": current_start,
-                "end": current_start + len(current_chunk),
+                "end": current_start + current_len,
             })
             current_start = char_pos
-            current_chunk = ""
+            current_pieces = []
+            current_len = 0
         
-        current_chunk += para + "\n\n"
+        current_pieces.append(para)
+        current_pieces.append("\n\n")
+        current_len += len(para) + 2
         char_pos += len(para) + 2
     
+    current_chunk = "".join(current_pieces)
     if current_chunk.strip():
         chunks.append({
             "text": current_chunk.strip(),
             "start": current_start,
-            "end": current_start + len(current_chunk),
+            "end": current_start + current_len,
         })
     
     return chunks
 
-def recursive_chunking(text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
-    """Recursive character text splitter."""
+def _separator_pieces(text: str, start: int, end: int, separator: str) -> Iterator[Tuple[int, int]]:
+    """Yield contiguous (start, end) pieces of text[start:end], each keeping its trailing separator."""
+    if not separator:
+        for i in range(start, end):
+            yield i, i + 1
+        return
+    width = len(separator)
+    pos = start
+    while True:
+        idx = text.find(separator, pos, end)
+        if idx < 0:
+            break
+        yield pos, idx + width
+        pos = idx + width
+    if pos < end:
+        yield pos, end
+
+
+def recursive_spans(text: str, chunk_size: int) -> ChunkSpans:
+    """Recursive character text splitter, as chunk offsets."""
     separators = ["\n\n", "\n", ". ", " ", ""]
     
-    def split_text(text: str, separators: List[str]) -> List[str]:
-        if not separators:
-            return [text]
-        
-        separator = separators[0]
-        splits = text.split(separator) if separator else list(text)
-        
-        chunks = []
-        current = ""
+    # Work stack of (start, end, separator level); level None marks a finished
+    # chunk. Everything is an offset pair into text, so nothing is concatenated
+    # and chunks are exact slices of the original.
+    starts: List[int] = []
+    ends: List[int] = []
+    stack: List[Tuple[int, int, Any]] = [(0, len(text), 0)]
+    
+    while stack:
+        start, end, level = stack.pop()
+        if level is None or level == len(separators):
+            # Avoid empty chunks (checked in place, without slicing)
+            if _NON_SPACE_RE.search(text, start, end):
+                starts.append(start)
+                ends.append(end)
+            continue
         
-        for split in splits:
-            piece = split + separator if separator else split
-            if len(current) + len(piece) > chunk_size:
-                if current:
-                    chunks.append(current)
-                if len(piece) > chunk_size:
-                    chunks.extend(split_text(piece, separators[1:]))
-                    current = ""
+        work = []
+        current_start = current_end = start
+        for piece_start, piece_end in _separator_pieces(text, start, end, separators[level]):
+            if (current_end - current_start) + (piece_end - piece_start) > chunk_size:
+                if current_end > current_start:
+                    work.append((current_start, current_end, None))
+                if piece_end - piece_start > chunk_size:
+                    work.append((piece_start, piece_end, level + 1))
+                    current_start = current_end = piece_end
                 else:
-                    current = piece
+                    current_start, current_end = piece_start, piece_end
             else:
-                current += piece
+                current_end = piece_end
+        if current_end > current_start:
+            work.append((current_start, current_end, None))
         
-        if current:
-            chunks.append(current)
-        
-        return chunks
-    
-    raw_chunks = split_text(text, separators)
+        # Reversed so the stack pops pieces in document order
+        stack.extend(reversed(work))
     
-    chunks = []
-    pos = 0
-    for chunk in raw_chunks:
-        # Avoid empty chunks
-        if not chunk.strip():
-            pos += len(chunk)
-            continue
-            
-        chunks.append({
-            "text": chunk,
-            "start": pos,
-            "end": pos + len(chunk),
-        })
-        pos += len(chunk)
-    
-    return chunks
+    return ChunkSpans.from_lists(text, starts, ends)
+
+def recursive_chunking(text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
+    """Recursive character text splitter."""
+    return recursive_spans(text, chunk_size).to_dicts()
@@ -0,0 +1,89 @@
+"""
+Process-wide model factories shared by the chunkers.
+
+Loading a spaCy pipeline or a SentenceTransformer takes seconds and hundreds
+of MB, so each is built once per process (per name) and reused by every
+chunker instance.
+"""
+from functools import lru_cache
+
+import spacy
+import torch
+from spacy.lang.en import English
+from sentence_transformers import SentenceTransformer
+
+from app.config import settings
+from app.core.errors import AppException
+from app.core.logging import get_logger
+
+try:
+    import optimum.onnxruntime as optimum_ort  # enables SentenceTransformer(backend="onnx")
+except ImportError:
+    optimum_ort = None
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_sentencizer() -> spacy.language.Language:
+    """
+    Rule-based English sentence splitter.
+    
+    The chunkers only need doc.sents, never POS tags or dependencies, so a
+    blank tokenizer plus the punctuation-driven sentencizer replaces the
+    statistical parser: no model download, and orders of magnitude less
+    work per document.
+    """
+    nlp = English()
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+@lru_cache(maxsize=32)
+def sentence_spans(text: str) -> tuple[tuple[int, int], ...]:
+    """
+    (start_char, end_char) of each sentence in text, memoized per text.
+    
+    Both spaCy chunkers split with the same sentencizer, so running them on
+    one document (e.g. an A/B comparison) segments it once. The cache is
+    keyed on the string itself: str caches its own hash, and equality
+    settles collisions. It is kept small because it pins whole documents.
+    """
+    doc = get_sentencizer()(text)
+    return tuple((sent.start_char, sent.end_char) for sent in doc.sents)
+
+
+def _load_onnx(name: str) -> SentenceTransformer | None:
+    """ONNX Runtime encoder for CPU hosts, or None to fall back to torch."""
+    model_kwargs = {}
+    if settings.sbert_onnx_file:
+        # e.g. "onnx/model_qint8_avx512_vnni.onnx" for int8 dynamic quantization
+        model_kwargs["file_name"] = settings.sbert_onnx_file
+    try:
+        return SentenceTransformer(name, backend="onnx", model_kwargs=model_kwargs)
+    except Exception as e:
+        logger.warning("onnx_model_load_failed", model=name, error=str(e))
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_sbert(name: str) -> SentenceTransformer:
+    """
+    Load a SentenceTransformer embedding model.
+    
+    On GPU the weights are cast to FP16; on CPU the ONNX Runtime backend is
+    used when optimum is installed. Encoding at chunking batch sizes is
+    memory-bandwidth bound, so narrower weights translate into throughput.
+    """
+    logger.info("loading_embedding_model", model=name)
+    try:
+        if torch.cuda.is_available():
+            return SentenceTransformer(name, device="cuda").half()
+        if optimum_ort is not None:
+            model = _load_onnx(name)
+            if model is not None:
+                return model
+        return SentenceTransformer(name)
+    except Exception as e:
+        logger.error("model_load_failed", error=str(e))
+        raise AppException(f"Failed to load embedding model: {str(e)}", 500)
@@ -1,7 +1,36 @@
+import re
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 from app.schemas.chunk import ChunkingConfig
 
+try:
+    import re2  # google-re2: linear-time automaton, no backtracking
+except ImportError:
+    re2 = None
+
+
+# Python's Unicode \s as an explicit class. RE2's \s is ASCII-only
+# ([\t\n\f\r ]), so splitter patterns use this instead of \s to behave
+# the same on both engines (NBSP, U+2028 etc. included).
+SPACE = (
+    "[\t\n\v\f\r \x1c-\x1f\x85\xa0\u1680\u2000-\u200a"
+    "\u2028\u2029\u202f\u205f\u3000]"
+)
+
+
+def compile_pattern(pattern: str):
+    r"""
+    Compile a splitter pattern with RE2 when google-re2 is installed, else re.
+    
+    Flags must be inline (e.g. "(?m)") and whitespace spelled as SPACE rather
+    than \s so the pattern means the same to both engines; the returned
+    object supports finditer/split either way.
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
 class BaseChunker(ABC):
     """
     Abstract base class for all chunking methods.
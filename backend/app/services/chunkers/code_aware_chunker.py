@@ -1,7 +1,12 @@
 from typing import List, Dict, Any
 import re
 from app.schemas.chunk import ChunkingConfig
-from .base import BaseChunker
+from .base import SPACE, BaseChunker, compile_pattern
+
+# Fenced code blocks: ```...```; DOTALL so .*? spans newlines
+_CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+# Blank-line paragraph breaks within prose
+_PROSE_RE = compile_pattern(r'\n' + SPACE + r'*\n')
 
 class CodeAwareChunker(BaseChunker):
     """
@@ -10,14 +15,10 @@ class CodeAwareChunker(BaseChunker):
     """
     
     def chunk(self, text: str, config: ChunkingConfig) -> List[Dict[str, Any]]:
-        # Regex to find code blocks: ```...```
-        # flags=re.DOTALL to match newlines inside .*?
-        code_block_pattern = re.compile(r'```.*?```', re.DOTALL)
-        
         chunks = []
         last_idx = 0
         
-        for match in code_block_pattern.finditer(text):
+        for match in _CODE_BLOCK_RE.finditer(text):
             start, end = match.span()
             
             # Process text BEFORE the code block (prose)
@@ -52,9 +53,8 @@ class CodeAwareChunker(BaseChunker):
         # To be safe and simple, let's treat prose as "ParagraphChunker" logic or simple newline split
         
         # Simple implementation: Split by double newlines for prose sections
-        pattern = re.compile(r'\n\s*\n')
         last_end = 0
-        for match in pattern.finditer(text):
+        for match in _PROSE_RE.finditer(text):
             p_start, p_end = match.span()
             if p_start > last_end:
                 chunks.append({
@@ -1,7 +1,10 @@
 from typing import List, Dict, Any
-import re
 from app.schemas.chunk import ChunkingConfig
-from .base import BaseChunker
+from .base import SPACE, BaseChunker, compile_pattern
+
+# Markdown headers: start of line, #+, space, text
+# (?m) multiline is essential for ^ to match start of lines
+_HEADING_RE = compile_pattern(r'(?m)^(#{1,6})' + SPACE + r'+(.+)$')
 
 class HeadingBasedChunker(BaseChunker):
     """
@@ -10,11 +13,7 @@ class HeadingBasedChunker(BaseChunker):
     """
     
     def chunk(self, text: str, config: ChunkingConfig) -> List[Dict[str, Any]]:
-        # Regex to match headers: start of line (or string), #+, space, text
-        # re.MULTILINE is essential for ^ to match start of lines
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-        
-        matches = list(heading_pattern.finditer(text))
+        matches = list(_HEADING_RE.finditer(text))
         chunks = []
         
         if not matches:
@@ -1,7 +1,9 @@
 from typing import List, Dict, Any
-import re
 from app.schemas.chunk import ChunkingConfig
-from .base import BaseChunker
+from .base import SPACE, BaseChunker, compile_pattern
+
+# Double newlines (or more), captured so separators keep their offsets
+_PARA_RE = compile_pattern(r'(\n' + SPACE + r'*\n)')
 
 class ParagraphChunker(BaseChunker):
     """
@@ -17,9 +19,10 @@ class ParagraphChunker(BaseChunker):
             return []
             
         chunks = []
-        paragraphs = re.split(r'(\n\s*\n)', text)
+        paragraphs = _PARA_RE.split(text)
         
-        current_chunk = ""
+        # The accumulated chunk is always text[current_start:pos]; slice it on
+        # flush instead of growing a string with += per paragraph
         current_start = 0
         pos = 0
         
@@ -29,25 +32,23 @@ class ParagraphChunker(BaseChunker):
             sep = paragraphs[i+1] if i + 1 < len(paragraphs) else ""
             
             # Check if adding this paragraph exceeds max_chunk_size
-            if len(current_chunk) + len(para) > config.chunk_size and current_chunk:
+            if (pos - current_start) + len(para) > config.chunk_size and pos > current_start:
                 chunks.append({
-                    "text": current_chunk.strip(),
+                    "text": text[current_start:pos].strip(),
                     "start_char": current_start,
-                    "end_char": current_start + len(current_chunk)
+                    "end_char": pos
                 })
                 # Reset
                 current_start = pos
-                current_chunk = para + sep
-            else:
-                current_chunk += para + sep
                 
             pos += len(para) + len(sep)
-            
+        
+        current_chunk = text[current_start:pos]
         if current_chunk.strip():
             chunks.append({
                 "text": current_chunk.strip(),
                 "start_char": current_start,
-                "end_char": current_start + len(current_chunk)
+                "end_char": pos
             })
             
         return chunks
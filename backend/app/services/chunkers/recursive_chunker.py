@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import re
 from app.schemas.chunk import ChunkingConfig
 from .base import BaseChunker
@@ -11,86 +11,103 @@ class RecursiveChunker(BaseChunker):
     
     def __init__(self):
         self.separators = ["\n\n", "\n", " ", ""]
+        # Literal patterns compiled once; "" is the hard split, not a regex
+        self._patterns = [re.compile(re.escape(sep)) if sep else None for sep in self.separators]
 
     def chunk(self, text: str, config: ChunkingConfig) -> List[Dict[str, Any]]:
-        return self._recursive_split(text, self.separators, config.chunk_size, config.overlap)
+        return self._recursive_split(text, 0, len(text), 0, config.chunk_size, config.overlap)
 
-    def _recursive_split(self, text: str, separators: List[str], chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
-        final_chunks = []
-        if not separators:
-            # Base case: if no separators left, hard split by character
-            return self._create_chunks(text, chunk_size, overlap)
-            
-        separator = separators[0]
-        new_separators = separators[1:]
+    def _piece_spans(self, text: str, start: int, end: int, level: int) -> List[Tuple[int, int]]:
+        """
+        (start, end) of each piece of text[start:end] between separator matches.
         
-        # Split by current separator
-        if separator == "":
-            splits = list(text)
-        else:
-            # Use regex literal to escape special chars if needed, or just basic split
-            # For simplicity using standard string split for now, but regex is better for consistency
-            splits = text.split(separator)
+        Same pieces as text[start:end].split(separator), found by scanning the
+        original string in place instead of copying every piece out of it.
+        """
+        pattern = self._patterns[level]
+        spans = []
+        cursor = start
+        for match in pattern.finditer(text, start, end):
+            spans.append((cursor, match.start()))
+            cursor = match.end()
+        spans.append((cursor, end))
+        return spans
+
+    def _recursive_split(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        level: int,
+        chunk_size: int,
+        overlap: int,
+    ) -> List[Dict[str, Any]]:
+        """Chunk text[start:end] using separators from self.separators[level] on."""
+        if level >= len(self.separators) or not self.separators[level]:
+            # Base case: no separators left (or the "" separator), so hard
+            # split by character without materialising one string per char
+            return self._create_chunks(text, start, end, chunk_size, overlap)
             
-        # Re-assemble chunks
-        current_chunk = []
+        separator_len = len(self.separators[level])
+        final_chunks = []
+        
+        # Re-assemble pieces into chunks, tracking only the span they cover:
+        # consecutive pieces joined by the separator are exactly text[first:last]
+        chunk_start = None
+        chunk_end = start
         current_len = 0
         
-        for split in splits:
-            split_len = len(split)
-            if current_len + split_len + len(separator) > chunk_size:
-                # If current chunk is full, verify if we need to split the LAST element further
-                # But here we just finalize current_chunk and start new
-                if current_chunk:
-                    joined_text = separator.join(current_chunk)
-                    if len(joined_text) > chunk_size:
-                        # Recursively split this oversized chunk
-                        sub_chunks = self._recursive_split(joined_text, new_separators, chunk_size, overlap)
-                        final_chunks.extend(sub_chunks)
-                    else:
-                        final_chunks.append(self._make_chunk(joined_text, text))
-                    
-                    current_chunk = []
+        for piece_start, piece_end in self._piece_spans(text, start, end, level):
+            piece_len = piece_end - piece_start
+            if current_len + piece_len + separator_len > chunk_size:
+                # Current chunk is full: finalize it and start a new one
+                if chunk_start is not None:
+                    final_chunks.extend(
+                        self._finish_chunk(text, chunk_start, chunk_end, level, chunk_size, overlap)
+                    )
+                    chunk_start = None
                     current_len = 0
             
-            current_chunk.append(split)
-            current_len += split_len + len(separator)
+            if chunk_start is None:
+                chunk_start = piece_start
+            chunk_end = piece_end
+            current_len += piece_len + separator_len
             
         # Handle last chunk
-        if current_chunk:
-            joined_text = separator.join(current_chunk)
-            if len(joined_text) > chunk_size:
-                sub_chunks = self._recursive_split(joined_text, new_separators, chunk_size, overlap)
-                final_chunks.extend(sub_chunks)
-            else:
-                final_chunks.append(self._make_chunk(joined_text, text))
+        if chunk_start is not None:
+            final_chunks.extend(
+                self._finish_chunk(text, chunk_start, chunk_end, level, chunk_size, overlap)
+            )
                 
         return final_chunks
 
-    def _create_chunks(self, text: str, size: int, overlap: int) -> List[Dict[str, Any]]:
-        """Hard split by character length"""
-        chunks = []
-        start = 0
-        while start < len(text):
-            end = min(start + size, len(text))
-            chunk_text = text[start:end]
-            chunks.append(self._make_chunk(chunk_text, text, start))
-            start += size - overlap
-        return chunks
+    def _finish_chunk(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        level: int,
+        chunk_size: int,
+        overlap: int,
+    ) -> List[Dict[str, Any]]:
+        """Emit text[start:end], recursing with finer separators if oversized."""
+        if end - start > chunk_size:
+            return self._recursive_split(text, start, end, level + 1, chunk_size, overlap)
+        return [self._make_chunk(text, start, end)]
 
-    def _make_chunk(self, chunk_text: str, original_text: str, start_index: int = -1) -> Dict[str, Any]:
-        # Note: Finding exact start_char in original text can be tricky if duplicates exist.
-        # Ideally we pass offsets down the recursion. 
-        # For this quick implementation, we'll try to find it or just return text.
-        # In a real robust implementation, we track start_offset through recursion.
-        
-        # This is a simplified version.
-        if start_index == -1:
-            # Try to find text (this is naive and fails with duplicates)
-            start_index = original_text.find(chunk_text)
-            
+    def _create_chunks(self, text: str, start: int, end: int, size: int, overlap: int) -> List[Dict[str, Any]]:
+        """Hard split text[start:end] by character length"""
+        # overlap >= size would never advance; treat it as no overlap
+        stride = size - overlap if 0 <= overlap < size else size
+        return [
+            self._make_chunk(text, pos, min(pos + size, end))
+            for pos in range(start, end, stride)
+        ]
+
+    def _make_chunk(self, text: str, start: int, end: int) -> Dict[str, Any]:
+        """Chunk dict for text[start:end]; offsets come down the recursion."""
         return {
-            "text": chunk_text,
-            "start_char": start_index,
-            "end_char": start_index + len(chunk_text)
+            "text": text[start:end],
+            "start_char": start,
+            "end_char": end
         }
@@ -1,60 +1,74 @@
+import re
 import numpy as np
 import spacy
-from typing import List, Optional, Dict, Any
+import torch
+import torch.nn.functional as F
+from typing import List, Dict, Any, Tuple
 from sentence_transformers import SentenceTransformer
 from app.schemas.chunk import ChunkingConfig
 from app.core.logging import get_logger
-from app.core.errors import AppException
+from ._models import get_sbert, get_sentencizer, sentence_spans
 from .base import BaseChunker
 
 logger = get_logger(__name__)
 
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+def _gap_similarities(embeddings: torch.Tensor, window_size: int) -> np.ndarray:
+    """
+    Cosine similarity across every gap between consecutive sentences.
+    
+    Gap i sits between sentences i and i+1 and compares the window of up to
+    window_size sentences ending at i with the window starting at i+1. Window
+    sums come from one prefix sum over the embeddings (cosine ignores scale,
+    so sums stand in for means), and all gaps are scored in a single batched
+    pass instead of a Python loop per gap. The work stays on the device the
+    encoder produced the embeddings on; only the N-1 scores are copied back.
+    """
+    # Windows of neighbouring gaps overlap, so np.add.reduceat (which sums each
+    # slice independently) would redo O(window_size) work per gap; two prefix
+    # lookups per window keep it O(1) regardless of window_size. The leading
+    # zero row stands in for an "empty prefix" without a np.where branch.
+    # float64 keeps the prefix differences exact enough for long documents.
+    n = embeddings.shape[0]
+    prefix = embeddings.new_zeros((n + 1, embeddings.shape[1]), dtype=torch.float64)
+    torch.cumsum(embeddings, dim=0, dtype=torch.float64, out=prefix[1:])
+    
+    gap = torch.arange(1, n, device=embeddings.device)  # prefix index of the first sentence right of each gap
+    start_left = (gap - window_size).clamp(min=0)
+    end_right = (gap + window_size).clamp(max=n)
+    left = prefix[gap] - prefix[start_left]
+    right = prefix[end_right] - prefix[gap]
+    return F.cosine_similarity(left, right, dim=1).cpu().numpy()
+
 class SemanticChunker(BaseChunker):
     """
     Semantic chunking using SentenceTransformers and adaptive thresholding.
     follows the 'Percentile-Based Gradient Splitting' design.
     """
     
-    _model_instance: Optional[SentenceTransformer] = None
-    _nlp_instance: Optional[spacy.language.Language] = None
-    
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
         self.model_name = model_name
+        # Warm the shared models up front so the first chunk() is not slow
         self._ensure_model_loaded()
         self._ensure_spacy_loaded()
 
     def _ensure_model_loaded(self):
-        """Lazy load the embedding model."""
-        if SemanticChunker._model_instance is None:
-            logger.info("loading_embedding_model", model=self.model_name)
-            try:
-                SemanticChunker._model_instance = SentenceTransformer(self.model_name)
-            except Exception as e:
-                logger.error("model_load_failed", error=str(e))
-                raise AppException(f"Failed to load embedding model: {str(e)}", 500)
+        """Load (or fetch the cached) embedding model."""
+        get_sbert(self.model_name)
 
     def _ensure_spacy_loaded(self):
-        """Lazy load Spacy model."""
-        if SemanticChunker._nlp_instance is None:
-            try:
-                SemanticChunker._nlp_instance = spacy.load("en_core_web_sm")
-            except OSError:
-                logger.info("downloading_spacy_model", model="en_core_web_sm")
-                from spacy.cli import download
-                download("en_core_web_sm")
-                SemanticChunker._nlp_instance = spacy.load("en_core_web_sm")
+        """Build (or fetch the cached) Spacy sentence splitter."""
+        get_sentencizer()
 
     @property
     def model(self) -> SentenceTransformer:
-        if self._model_instance is None:
-            self._ensure_model_loaded()
-        return self._model_instance # type: ignore
+        return get_sbert(self.model_name)
 
     @property
     def nlp(self) -> spacy.language.Language:
-        if self._nlp_instance is None:
-            self._ensure_spacy_loaded()
-        return self._nlp_instance # type: ignore
+        return get_sentencizer()
 
     def chunk(self, text: str, config: ChunkingConfig) -> List[Dict[str, Any]]:
         """
@@ -63,103 +77,76 @@ class SemanticChunker(BaseChunker):
         if not text.strip():
             return []
 
-        # 1. Split Sentences with Spacy (preserves offsets)
-        doc = self.nlp(text)
-        sentences = [] 
-        for sent in doc.sents:
-            if sent.text.strip():
-                sentences.append(sent)
-        
+        # 1. Split Sentences (preserves offsets), dropping whitespace-only ones
+        # without copying each one out to strip it
+        sentences = [
+            (start, end) for start, end in sentence_spans(text)
+            if _NON_SPACE_RE.search(text, start, end)
+        ]
         if not sentences:
             return []
-            
         if len(sentences) == 1:
-            sent = sentences[0]
-            return [{"text": sent.text, "start_char": sent.start_char, "end_char": sent.end_char}]
+            start, end = sentences[0]
+            return [{"text": text[start:end], "start_char": start, "end_char": end}]
 
         # 2. Embed Sentences Individually (Optimization: encode N sentences instead of N*Window tokens)
-        # using batch_size for speed
-        sentence_texts = [s.text for s in sentences]
-        embeddings = self.model.encode(sentence_texts, batch_size=64, convert_to_numpy=True)
-        # Normalize embeddings for fast cosine sim (dot product)
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        embeddings = embeddings / norms
+        # using batch_size for speed. encode() already length-sorts its inputs
+        # so each batch pads only to its own longest sentence (smart batching)
+        # and returns rows in input order; pre-sorting here would be redundant.
+        # The embeddings stay a tensor on the encoder's device, unit length so
+        # each sentence weighs equally in its window sum.
+        embeddings = self.model.encode(
+            [text[start:end] for start, end in sentences],
+            batch_size=64, convert_to_tensor=True, normalize_embeddings=True,
+        )
+        return self._split(text, sentences, embeddings, config)
 
+    def _split(
+        self,
+        text: str,
+        sentences: List[Tuple[int, int]],
+        embeddings: torch.Tensor,
+        config: ChunkingConfig,
+    ) -> List[Dict[str, Any]]:
+        """Group a text's sentences into chunks at semantic valleys."""
         # 3. Calculate Distance at each gap
         # We check the gap between sentence i and i+1
         # using config.window_size to aggregate context on Left and Right of the gap.
         window_size = max(1, config.window_size) # Ensure at least 1 sentence
-        similarities = []
+        similarities = _gap_similarities(embeddings, window_size)
         
-        for i in range(len(sentences) - 1):
-            # Gap is after sentence i (i.e., between i and i+1)
-            
-            # Left Window: ends at i (inclusive)
-            # range: [max(0, i - window + 1) : i + 1]
-            start_left = max(0, i - window_size + 1)
-            end_left = i + 1
-            
-            # Right Window: starts at i + 1
-            # range: [i + 1 : min(N, i + 1 + window)]
-            start_right = i + 1
-            end_right = min(len(sentences), i + 1 + window_size)
-            
-            # Compute mean embeddings
-            # Note: embeddings are already normalized individually, 
-            # but mean of normalized vectors is not necessarily normalized.
-            # However, for directionality, it works.
-            emb_left = np.mean(embeddings[start_left:end_left], axis=0)
-            emb_right = np.mean(embeddings[start_right:end_right], axis=0)
-            
-            # Cosine similarity
-            sim = np.dot(emb_left, emb_right) / (np.linalg.norm(emb_left) * np.linalg.norm(emb_right))
-            similarities.append(sim)
-            
         # 5. Threshold (Local Minima / Valley Detection)
         # We only split if the similarity is a local minimum (valley) AND below threshold.
         # This prevents splitting on "slopes" where similarity is decreasing towards a topic shift,
         # ensuring we split exactly AT the shift (the lowest point).
-        split_threshold = config.threshold
+        # Valleys are found in one vectorized pass; the ends count as 1.0 so
+        # they never block a valley, and <= catches plateaus.
+        padded = np.concatenate(([1.0], similarities, [1.0]))
+        is_valley = (similarities <= padded[:-2]) & (similarities <= padded[2:])
+        candidates = np.flatnonzero(is_valley & (similarities < config.threshold))
         
+        # Gap i follows sentence i. Only the length constraint is sequential,
+        # so the loop visits candidate gaps rather than every gap.
         chunks = []
-        current_chunk_sents = [sentences[0]]
-        
-        n_sims = len(similarities)
-        for i in range(n_sims):
-            sim = similarities[i]
-            
-            # Check if this point is a local minimum (valley)
-            # Valley if: (left is higher or None) AND (right is higher or None)
-            val_left = similarities[i-1] if i > 0 else 1.0
-            val_right = similarities[i+1] if i < n_sims - 1 else 1.0
-            
-            # Use <= to catch plateaus (though exact float equality is rare)
-            is_valley = (sim <= val_left) and (sim <= val_right)
-            
-            # Check length constraint
-            curr_start = current_chunk_sents[0].start_char
-            curr_end = current_chunk_sents[-1].end_char
-            
-            should_split = (sim < split_threshold) and is_valley
-            
-            if should_split and (curr_end - curr_start) >= config.min_chunk_size:
+        first = 0  # first sentence of the current chunk
+        for i in candidates.tolist():
+            curr_start = sentences[first][0]
+            curr_end = sentences[i][1]
+            if (curr_end - curr_start) >= config.min_chunk_size:
                 chunks.append({
                     "text": text[curr_start:curr_end],
                     "start_char": curr_start,
                     "end_char": curr_end
                 })
-                current_chunk_sents = []
-            
-            current_chunk_sents.append(sentences[i+1])
+                first = i + 1
             
         # Add final chunk
-        if current_chunk_sents:
-            curr_start = current_chunk_sents[0].start_char
-            curr_end = current_chunk_sents[-1].end_char
-            chunks.append({
-                "text": text[curr_start:curr_end],
-                "start_char": curr_start,
-                "end_char": curr_end
-            })
+        curr_start = sentences[first][0]
+        curr_end = sentences[-1][1]
+        chunks.append({
+            "text": text[curr_start:curr_end],
+            "start_char": curr_start,
+            "end_char": curr_end
+        })
             
         return chunks
@@ -1,7 +1,8 @@
 import spacy
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Sequence, Tuple
 from app.schemas.chunk import ChunkingConfig
 from app.core.logging import get_logger
+from ._models import get_sentencizer, sentence_spans
 from .base import BaseChunker
 
 logger = get_logger(__name__)
@@ -12,35 +13,30 @@ class SentenceWindowChunker(BaseChunker):
     Allows for overlapping windows.
     """
     
-    _nlp_instance: Optional[spacy.language.Language] = None
-    
     def __init__(self):
         self._ensure_spacy_loaded()
 
     def _ensure_spacy_loaded(self):
-        """Lazy load Spacy model."""
-        if SentenceWindowChunker._nlp_instance is None:
-            try:
-                SentenceWindowChunker._nlp_instance = spacy.load("en_core_web_sm")
-            except OSError:
-                logger.info("downloading_spacy_model", model="en_core_web_sm")
-                from spacy.cli import download
-                download("en_core_web_sm")
-                SentenceWindowChunker._nlp_instance = spacy.load("en_core_web_sm")
+        """Build (or fetch the cached) Spacy sentence splitter."""
+        get_sentencizer()
     
     @property
     def nlp(self) -> spacy.language.Language:
-        if self._nlp_instance is None:
-            self._ensure_spacy_loaded()
-        return self._nlp_instance # type: ignore
+        return get_sentencizer()
 
     def chunk(self, text: str, config: ChunkingConfig) -> List[Dict[str, Any]]:
         if not text.strip():
             return []
             
-        doc = self.nlp(text)
-        sentences = list(doc.sents)
-        
+        return self._windows(text, sentence_spans(text), config)
+
+    def _windows(
+        self,
+        text: str,
+        sentences: Sequence[Tuple[int, int]],
+        config: ChunkingConfig,
+    ) -> List[Dict[str, Any]]:
+        """Slide the sentence window over one text's (start, end) sentence spans."""
         if not sentences:
             return []
             
@@ -55,23 +51,22 @@ class SentenceWindowChunker(BaseChunker):
         overlap = config.overlap if config.overlap is not None else 1
         stride = max(1, window_size - overlap)
         
+        # Windows start every stride sentences until one reaches the last
+        # sentence; each chunk is then just two offset lookups and one slice
+        # (no per-window copy of the sentence list).
+        n = len(sentences)
+        n_windows = -(-max(n - window_size, 0) // stride) + 1
+        start_chars = [start for start, _ in sentences]
+        end_chars = [end for _, end in sentences]
+        
         chunks = []
-        for i in range(0, len(sentences), stride):
-            window = sentences[i : i + window_size]
-            if not window:
-                break
-                
-            start_char = window[0].start_char
-            end_char = window[-1].end_char
-            chunk_text = text[start_char:end_char]
-            
+        for i in range(0, n_windows * stride, stride):
+            start_char = start_chars[i]
+            end_char = end_chars[min(i + window_size, n) - 1]
             chunks.append({
-                "text": chunk_text,
+                "text": text[start_char:end_char],
                 "start_char": start_char,
                 "end_char": end_char
             })
-            
-            if i + window_size >= len(sentences):
-                break
                 
         return chunks
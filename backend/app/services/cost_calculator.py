@@ -18,13 +18,20 @@ class EmbeddingCostCalculator:
             "multi-qa-mpnet-base-dot-v1": 0.0,
         }
     }
+    
+    # (provider, model) -> price per 1M tokens: one hash lookup per call
+    _FLAT_PRICING = {
+        (provider, model): price
+        for provider, models in PRICING.items()
+        for model, price in models.items()
+    }
 
     @classmethod
     def calculate(cls, provider: str, model: str, token_count: int) -> float:
         """
         Calculate cost in USD.
         """
-        price_per_m = cls.PRICING.get(provider, {}).get(model, 0.0)
+        price_per_m = cls._FLAT_PRICING.get((provider, model), 0.0)
         return (token_count / 1_000_000) * price_per_m
 
     @classmethod
@@ -2,13 +2,14 @@
 Document Service
 Business logic for document upload, validation, and processing
 """
-import os
+import hashlib
 import uuid
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, NamedTuple
 
-import aiofiles
+import orjson
 from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.errors import BadRequestError
@@ -17,7 +18,7 @@ from app.core.database import async_session_maker
 from app.models import Document, DocumentType, Chunk, ChunkingMethod
 from app.services.pdf_processor import pdf_processor
 from app.services.chunker import apply_chunking
-from sqlalchemy import select, update, func
+from sqlalchemy import func, insert, select, update
 from fastapi.concurrency import run_in_threadpool
 
 logger = get_logger(__name__)
@@ -25,6 +26,21 @@ logger = get_logger(__name__)
 # PDF magic bytes
 PDF_MAGIC_BYTES = b"%PDF"
 
+# Above this many rows, chunks are streamed with COPY instead of ORM inserts
+COPY_BATCH_THRESHOLD = 100
+
+# Columns written by COPY; created_at and tsv are filled in by PostgreSQL
+_CHUNK_COPY_COLUMNS = (
+    "id",
+    "document_id",
+    "text",
+    "chunk_index",
+    "chunking_method",
+    "chunk_size",
+    "chunk_overlap",
+    "metadata",
+)
+
 # Allowed MIME types
 ALLOWED_CONTENT_TYPES = {
     "application/pdf": DocumentType.PDF,
@@ -43,6 +59,53 @@ EXTENSION_TO_TYPE = {
 }
 
 
+class SavedUpload(NamedTuple):
+    """An upload written to the upload directory by validate_and_save."""
+    filename: str
+    file_path: str
+    size_bytes: int
+    content_hash: str
+    file_type: DocumentType
+
+
+def _stream_upload(
+    src: BinaryIO,
+    dst_path: Path,
+    check_pdf_magic: bool,
+    max_bytes: int,
+) -> tuple[int, str]:
+    """
+    Validate, hash and copy an upload in a single read pass.
+    
+    Returns (bytes_written, blake2b hex digest). The partially written file
+    is removed if the upload is rejected.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    total = 0
+    src.seek(0)
+    try:
+        with open(dst_path, "wb") as dst:
+            if check_pdf_magic:
+                header = src.read(len(PDF_MAGIC_BYTES))
+                if header != PDF_MAGIC_BYTES:
+                    raise BadRequestError("Invalid PDF file (corrupted or not a PDF)")
+                h.update(header)
+                dst.write(header)
+                total = len(header)
+            while chunk := src.read(1 << 20):
+                total += len(chunk)
+                if total > max_bytes:
+                    raise BadRequestError(
+                        f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+                    )
+                h.update(chunk)
+                dst.write(chunk)
+    except BaseException:
+        dst_path.unlink(missing_ok=True)
+        raise
+    return total, h.hexdigest()
+
+
 class DocumentService:
     """Service for document operations."""
     
@@ -52,7 +115,10 @@ class DocumentService:
     
     async def validate_upload(self, file: UploadFile) -> DocumentType:
         """
-        Validate uploaded file.
+        Validate an upload's filename and declared type.
+        
+        Content checks (PDF magic bytes, size) happen while the file is
+        written in validate_and_save, so this does not read the body.
         
         Returns:
             DocumentType if valid
@@ -80,43 +146,22 @@ class DocumentService:
                 content_type=file.content_type,
             )
         
-        # For PDFs, validate magic bytes
-        if ext == ".pdf":
-            header = await file.read(4)
-            await file.seek(0)  # Reset position
-            
-            if header != PDF_MAGIC_BYTES:
-                raise BadRequestError("Invalid PDF file (corrupted or not a PDF)")
-        
-        # Check file size by reading chunks
-        total_size = 0
-        chunk_size = 64 * 1024  # 64KB chunks
-        
-        while True:
-            chunk = await file.read(chunk_size)
-            if not chunk:
-                break
-            total_size += len(chunk)
-            
-            if total_size > self.max_size_bytes:
-                raise BadRequestError(
-                    f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
-                )
-        
-        # Reset file position for later reading
-        await file.seek(0)
-        
         return EXTENSION_TO_TYPE[ext]
     
-    async def save_file(self, file: UploadFile, file_type: DocumentType) -> tuple[str, str, int]:
+    async def validate_and_save(self, file: UploadFile) -> SavedUpload:
         """
-        Save uploaded file to disk.
+        Validate an upload and save it to disk in one pass.
         
-        Returns:
-            Tuple of (stored_filename, file_path, file_size_bytes)
+        The body is read once: PDF magic bytes and the size limit are checked
+        while the bytes are written out and hashed for duplicate detection.
+        
+        Raises:
+            BadRequestError: If file is invalid
         """
+        file_type = await self.validate_upload(file)
+        
         # Generate unique filename
-        ext = Path(file.filename or "file").suffix.lower()
+        ext = Path(file.filename).suffix.lower()
         stored_filename = f"{uuid.uuid4().hex}{ext}"
         
         # Ensure upload directory exists
@@ -124,15 +169,14 @@ class DocumentService:
         
         file_path = self.upload_dir / stored_filename
         
-        # Stream file to disk
-        total_bytes = 0
-        async with aiofiles.open(file_path, "wb") as f:
-            while True:
-                chunk = await file.read(64 * 1024)  # 64KB chunks
-                if not chunk:
-                    break
-                await f.write(chunk)
-                total_bytes += len(chunk)
+        # One worker-thread hop for the whole copy rather than one per chunk
+        total_bytes, content_hash = await run_in_threadpool(
+            _stream_upload,
+            file.file,
+            file_path,
+            file_type == DocumentType.PDF,
+            self.max_size_bytes,
+        )
         
         logger.info(
             "file_saved",
@@ -141,14 +185,42 @@ class DocumentService:
             size_bytes=total_bytes,
         )
         
-        return stored_filename, str(file_path), total_bytes
+        return SavedUpload(
+            stored_filename, str(file_path), total_bytes, content_hash, file_type
+        )
+    
+    async def find_duplicate(
+        self, db: AsyncSession, user_id: uuid.UUID, content_hash: str
+    ) -> Document | None:
+        """
+        Return the user's existing document with identical content, if reusable.
+        
+        Documents whose stored file is gone or whose processing failed are
+        skipped, so re-uploading them creates and processes a fresh copy.
+        """
+        result = await db.execute(
+            select(Document)
+            .where(Document.user_id == user_id, Document.content_hash == content_hash)
+            .order_by(Document.is_processed.desc(), Document.created_at)
+        )
+        for document in result.scalars():
+            if "processing_error" in (document.doc_metadata or {}):
+                continue
+            if await run_in_threadpool(Path(document.file_path).exists):
+                return document
+        return None
+    
+    async def _mark_failed(self, db: AsyncSession, document_id: uuid.UUID, error: str) -> None:
+        """Record a processing failure on the document (read by find_duplicate)."""
+        try:
+            await db.rollback()
+            document = await db.get(Document, document_id)
+            if document is not None:
+                document.doc_metadata = {**(document.doc_metadata or {}), "processing_error": error}
+                await db.commit()
+        except Exception as e:
+            logger.error("processing_failure_not_recorded", document_id=str(document_id), error=str(e))
     
-        if path.exists():
-            path.unlink()
-            logger.info("file_deleted", path=file_path)
-            return True
-        return False
-
     async def process_document(self, document_id: uuid.UUID) -> bool:
         """
         Process a document to extract text and metadata.
@@ -172,6 +244,7 @@ class DocumentService:
                 file_path = Path(document.file_path)
                 if not file_path.exists():
                     logger.error("processing_failed", error="File not found", path=str(file_path))
+                    await self._mark_failed(db, document_id, "File not found")
                     return False
                 
                 # Process based on type
@@ -211,22 +284,16 @@ class DocumentService:
                             overlap=50
                         )
                         
-                        db_chunks = []
-                        for i, c_data in enumerate(chunks_data):
-                            new_chunk = Chunk(
-                                document_id=document_id,
-                                text=c_data["text"],
-                                chunk_index=i,
-                                chunking_method=ChunkingMethod.RECURSIVE,
-                                chunk_size=512,
-                                chunk_overlap=50,
-                                chunk_metadata={"start": c_data["start"], "end": c_data["end"]}
-                            )
-                            db_chunks.append(new_chunk)
-                        
-                        if db_chunks:
-                            db.add_all(db_chunks)
-                            logger.info("default_chunks_generated", document_id=str(document_id), count=len(db_chunks))
+                        count = await self._save_chunks(
+                            db,
+                            document_id,
+                            chunks_data,
+                            method=ChunkingMethod.RECURSIVE,
+                            chunk_size=512,
+                            overlap=50,
+                        )
+                        if count:
+                            logger.info("default_chunks_generated", document_id=str(document_id), count=count)
 
                     # Save changes
                     db.add(document)
@@ -246,10 +313,80 @@ class DocumentService:
                     
             except Exception as e:
                 logger.error("processing_failed", document_id=str(document_id), error=str(e))
-                # Optionally update document status to failed if we had a status field
-                # For now just log it
+                await self._mark_failed(db, document_id, str(e))
                 return False
 
 
+    async def _save_chunks(
+        self,
+        db: AsyncSession,
+        document_id: uuid.UUID,
+        chunks_data: list[dict],
+        method: ChunkingMethod,
+        chunk_size: int,
+        overlap: int,
+    ) -> int:
+        """
+        Persist chunker output for a document.
+        
+        Large batches on asyncpg are streamed with COPY on the session's own
+        connection, so they commit or roll back with the rest of the
+        transaction. Small batches and other backends use a Core bulk insert.
+        
+        Returns:
+            Number of chunks written
+        """
+        if not chunks_data:
+            return 0
+        
+        bind = db.bind
+        if (
+            len(chunks_data) > COPY_BATCH_THRESHOLD
+            and bind is not None
+            and bind.dialect.driver == "asyncpg"
+        ):
+            records = [
+                (
+                    uuid.uuid4(),
+                    document_id,
+                    c_data["text"],
+                    i,
+                    method.value,
+                    chunk_size,
+                    overlap,
+                    # asyncpg's jsonb codec takes text
+                    orjson.dumps({"start": c_data["start"], "end": c_data["end"]}).decode(),
+                )
+                for i, c_data in enumerate(chunks_data)
+            ]
+            conn = await db.connection()
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Chunk.__tablename__,
+                records=records,
+                columns=_CHUNK_COPY_COLUMNS,
+            )
+            return len(records)
+        
+        # Core executemany: no identity map or unit-of-work bookkeeping per row.
+        # Keys are column names, so the JSONB column is "metadata" here.
+        await db.execute(
+            insert(Chunk.__table__),
+            [
+                {
+                    "document_id": document_id,
+                    "text": c_data["text"],
+                    "chunk_index": i,
+                    "chunking_method": method,
+                    "chunk_size": chunk_size,
+                    "chunk_overlap": overlap,
+                    "metadata": {"start": c_data["start"], "end": c_data["end"]},
+                }
+                for i, c_data in enumerate(chunks_data)
+            ],
+        )
+        return len(chunks_data)
+
+
 # Singleton instance
 document_service = DocumentService()
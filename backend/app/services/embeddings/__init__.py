@@ -1,19 +1,42 @@
+from functools import lru_cache
+
 from .base import BaseEmbedder
 from .openai_embedder import OpenAIEmbedder
 from .local_embedder import LocalHuggingFaceEmbedder
 from .cohere_embedder import CohereEmbedder
+from .cached_embedder import CachedEmbedderWrapper, with_disk_cache
 
-def get_embedder(provider: str, model_name: str, **kwargs) -> BaseEmbedder:
-    """
-    Factory function to get an embedder instance.
-    """
+
+@lru_cache(maxsize=8)
+def _get_embedder_cached(provider: str, model_name: str, kwargs_items: tuple) -> BaseEmbedder:
+    kwargs = dict(kwargs_items)
     if provider == "openai":
-        return OpenAIEmbedder(model_name=model_name, **kwargs)
+        embedder = OpenAIEmbedder(model_name=model_name, **kwargs)
     elif provider == "cohere":
-        return CohereEmbedder(model_name=model_name, **kwargs)
+        embedder = CohereEmbedder(model_name=model_name, **kwargs)
     elif provider == "local":
-        return LocalHuggingFaceEmbedder(model_name=model_name)
+        embedder = LocalHuggingFaceEmbedder(model_name=model_name, **kwargs)
     else:
         raise ValueError(f"Unknown embedding provider: {provider}")
+    return with_disk_cache(embedder)
+
+
+def get_embedder(provider: str, model_name: str, **kwargs) -> BaseEmbedder:
+    """
+    Factory function to get an embedder instance.
+    
+    Instances are memoized per (provider, model, kwargs), so repeated calls
+    share one client / one loaded model per process. With diskcache
+    installed, embeddings are also persisted per model and reused across
+    runs.
+    """
+    return _get_embedder_cached(provider, model_name, tuple(sorted(kwargs.items())))
 
-__all__ = ["BaseEmbedder", "OpenAIEmbedder", "CohereEmbedder", "LocalHuggingFaceEmbedder", "get_embedder"]
+__all__ = [
+    "BaseEmbedder",
+    "OpenAIEmbedder",
+    "CohereEmbedder",
+    "LocalHuggingFaceEmbedder",
+    "CachedEmbedderWrapper",
+    "get_embedder",
+]
@@ -0,0 +1,84 @@
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, MutableMapping
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.services.embeddings.base import BaseEmbedder
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbedderWrapper(BaseEmbedder):
+    """
+    Embedder decorator that reuses vectors for texts it has already embedded.
+
+    Entries are keyed by a blake2b digest of the text; the store is expected
+    to be scoped to a single provider/model (see with_disk_cache).
+    """
+
+    def __init__(self, inner: BaseEmbedder, cache: MutableMapping):
+        self.inner = inner
+        self.cache = cache
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    @property
+    def dimensions(self) -> int:
+        return self.inner.dimensions
+
+    @property
+    def cost_per_million_tokens(self) -> float:
+        return self.inner.cost_per_million_tokens
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        for key in keys:
+            vector = self.cache.get(key)
+            if vector is not None:
+                found[key] = vector
+        return found
+
+    def _store(self, vectors: Dict[str, List[float]]) -> None:
+        for key, vector in vectors.items():
+            self.cache[key] = vector
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        keys = [hashlib.blake2b(t.encode(), digest_size=16).hexdigest() for t in texts]
+        # One worker-thread hop for all lookups; the store may be on disk
+        found = await run_in_threadpool(self._lookup, keys)
+
+        # Embed each distinct missing text once, even if repeated in the batch
+        missing = {k: t for k, t in zip(keys, texts) if k not in found}
+        if missing:
+            vectors = await self.inner.embed(list(missing.values()))
+            new = dict(zip(missing, vectors))
+            await run_in_threadpool(self._store, new)
+            found.update(new)
+
+        logger.debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return [found[k] for k in keys]
+
+
+def with_disk_cache(embedder: BaseEmbedder) -> BaseEmbedder:
+    """Wrap an embedder with a persistent per-model cache when diskcache is installed."""
+    if diskcache is None:
+        return embedder
+    cache_dir = Path(settings.cache_dir) / "emb" / embedder.provider_name / embedder.model_name
+    if getattr(embedder, "quantize", False):
+        # int8 vectors differ slightly from the FP32 model's; keep them apart
+        cache_dir = cache_dir.with_name(f"{cache_dir.name}-int8")
+    return CachedEmbedderWrapper(embedder, diskcache.Cache(str(cache_dir)))
@@ -1,8 +1,17 @@
 import logging
 import asyncio
+import threading
+from pathlib import Path
 from typing import List, Optional
+from app.config import settings
+from app.core.hardware import cpu_has_vnni
 from app.services.embeddings.base import BaseEmbedder
-from sentence_transformers import SentenceTransformer
+from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+try:
+    import optimum.onnxruntime as optimum_ort  # enables SentenceTransformer(backend="onnx")
+except ImportError:
+    optimum_ort = None
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +22,20 @@ class LocalHuggingFaceEmbedder(BaseEmbedder):
     """
     
     _model_cache = {}
+    # Serializes first loads so concurrent callers don't each load the weights
+    _model_lock = threading.RLock()
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int = 32,
+        quantize: bool = False,
+    ):
         self._model_name = model_name
         self._model = None
+        self.batch_size = batch_size
+        # int8 ONNX Runtime weights instead of FP32 PyTorch (CPU inference)
+        self.quantize = quantize
         
         # Metadata
         self._meta = {
@@ -26,10 +45,49 @@ class LocalHuggingFaceEmbedder(BaseEmbedder):
         }
 
     def _get_model(self, model_name: str) -> SentenceTransformer:
-        if model_name not in LocalHuggingFaceEmbedder._model_cache:
-            logger.info(f"Loading local embedding model: {model_name}")
-            LocalHuggingFaceEmbedder._model_cache[model_name] = SentenceTransformer(model_name)
-        return LocalHuggingFaceEmbedder._model_cache[model_name]
+        key = (model_name, "int8") if self.quantize else model_name
+        model = LocalHuggingFaceEmbedder._model_cache.get(key)
+        if model is not None:
+            return model
+        with LocalHuggingFaceEmbedder._model_lock:
+            if key not in LocalHuggingFaceEmbedder._model_cache:
+                logger.info(f"Loading local embedding model: {model_name}")
+                LocalHuggingFaceEmbedder._model_cache[key] = (
+                    self._load_quantized(model_name)
+                    if self.quantize
+                    else SentenceTransformer(model_name)
+                )
+            return LocalHuggingFaceEmbedder._model_cache[key]
+
+    @staticmethod
+    def _load_quantized(model_name: str) -> SentenceTransformer:
+        """
+        Load model_name as a dynamically quantized int8 ONNX model.
+
+        The ONNX export and quantization run once and are saved under
+        settings.onnx_model_dir. sentence-transformers keeps the model's own
+        pooling and normalization modules around the ONNX session, so vectors
+        match the PyTorch model up to quantization error. Falls back to the
+        FP32 PyTorch model when optimum is not installed or the export fails.
+        """
+        if optimum_ort is None:
+            logger.warning("optimum[onnxruntime] not installed; loading FP32 embedding model")
+            return SentenceTransformer(model_name)
+        config = "avx512_vnni" if cpu_has_vnni() else "avx2"
+        model_dir = Path(settings.onnx_model_dir) / "embeddings" / model_name.replace("/", "--")
+        file_name = f"onnx/model_qint8_{config}.onnx"
+        try:
+            if not (model_dir / file_name).exists():
+                logger.info(f"Exporting {model_name} to quantized ONNX (one-time)...")
+                exported = SentenceTransformer(model_name, backend="onnx")
+                exported.save(str(model_dir))
+                export_dynamic_quantized_onnx_model(exported, config, str(model_dir))
+            return SentenceTransformer(
+                str(model_dir), backend="onnx", model_kwargs={"file_name": file_name}
+            )
+        except Exception as e:
+            logger.warning(f"Quantized ONNX embedder unavailable for {model_name}, using PyTorch: {e}")
+            return SentenceTransformer(model_name)
 
     @property
     def provider_name(self) -> str:
@@ -63,10 +121,15 @@ class LocalHuggingFaceEmbedder(BaseEmbedder):
                 lambda: self._get_model(self._model_name)
             )
             
-        # SentenceTransformer.encode is synchronous, so we run it in a thread
+        # SentenceTransformer.encode is synchronous, so we run it in a thread.
+        # It already length-sorts the inputs into batches of batch_size (and
+        # restores the input order), so padding stays close to each batch's
+        # own longest text rather than the longest in the whole list.
         loop = asyncio.get_event_loop()
         embeddings = await loop.run_in_executor(
             None, 
-            lambda: self._model.encode(texts, convert_to_numpy=True)
+            lambda: self._model.encode(
+                texts, batch_size=self.batch_size, convert_to_numpy=True
+            )
         )
         return embeddings.tolist()
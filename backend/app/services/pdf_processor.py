@@ -8,19 +8,19 @@ from pathlib import Path
 from typing import Generator, Optional
 
 import fitz  # PyMuPDF
+import numpy as np
 
 from app.core.errors import CorruptedPDFError, PasswordProtectedError, PDFExtractionError
 from app.core.logging import get_logger
 from app.schemas.pdf_schemas import (
     BlockType,
+    CHAR_DTYPE,
     BoundingBox,
-    CharacterInfo,
     DocumentMetadata,
     ExtractedDocument,
     ExtractedPage,
     ExtractionOptions,
     Heading,
-    TableCell,
     TableData,
     TextBlock,
     TextLine,
@@ -29,7 +29,6 @@ from app.schemas.pdf_schemas import (
 
 logger = get_logger(__name__)
 
-
 class PDFProcessor:
     """
     PDF text extraction service with character-level coordinates.
@@ -261,7 +260,7 @@ class PDFProcessor:
         if opts.detect_headings:
             headings = self._extract_headings(blocks, page_num, avg_font_size)
         
-        return ExtractedPage(
+        return ExtractedPage.fast(
             page_number=page_num,
             width=rect.width,
             height=rect.height,
@@ -282,110 +281,79 @@ class PDFProcessor:
         # Use "dict" output for full structure
         page_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
         
+        # PyMuPDF output is trusted: build models with .fast() (no validation)
         blocks: list[TextBlock] = []
         
         for block_idx, block in enumerate(page_dict.get("blocks", [])):
             # Skip image blocks for now (type 1)
             if block.get("type") == 1:
                 continue
-                
-            bbox = BoundingBox(
-                x0=block["bbox"][0],
-                y0=block["bbox"][1],
-                x1=block["bbox"][2],
-                y1=block["bbox"][3]
-            )
             
             lines: list[TextLine] = []
             block_text_parts = []
             
             for line in block.get("lines", []):
-                line_bbox = BoundingBox(
-                    x0=line["bbox"][0],
-                    y0=line["bbox"][1],
-                    x1=line["bbox"][2],
-                    y1=line["bbox"][3]
-                )
-                
                 spans: list[TextSpan] = []
                 line_text_parts = []
                 
                 for span in line.get("spans", []):
-                    span_bbox = BoundingBox(
-                        x0=span["bbox"][0],
-                        y0=span["bbox"][1],
-                        x1=span["bbox"][2],
-                        y1=span["bbox"][3]
-                    )
-                    
-                    # Extract character-level info if requested
-                    characters: list[CharacterInfo] = []
-                    if opts.extract_characters:
-                        characters = self._extract_characters(span)
-                    
-                    text_span = TextSpan(
-                        text=span.get("text", ""),
-                        bbox=span_bbox,
+                    span_text = span.get("text", "")
+                    spans.append(TextSpan.fast(
+                        text=span_text,
+                        bbox=BoundingBox(*span["bbox"]),
                         font=span.get("font", ""),
                         size=span.get("size", 0),
                         flags=span.get("flags", 0),
                         color=span.get("color"),
-                        characters=characters
-                    )
-                    spans.append(text_span)
-                    line_text_parts.append(span.get("text", ""))
+                        # Character-level info only if requested
+                        char_array=(
+                            self._extract_characters(span)
+                            if opts.extract_characters else None
+                        ),
+                    ))
+                    line_text_parts.append(span_text)
                 
-                text_line = TextLine(
-                    text="".join(line_text_parts),
-                    bbox=line_bbox,
-                    spans=spans
-                )
-                lines.append(text_line)
-                block_text_parts.append(text_line.text)
+                line_text = "".join(line_text_parts)
+                lines.append(TextLine.fast(
+                    text=line_text,
+                    bbox=BoundingBox(*line["bbox"]),
+                    spans=spans,
+                ))
+                block_text_parts.append(line_text)
             
-            text_block = TextBlock(
+            blocks.append(TextBlock.fast(
                 text="\n".join(block_text_parts),
-                bbox=bbox,
+                bbox=BoundingBox(*block["bbox"]),
                 block_type=BlockType.TEXT,
                 block_number=block_idx,
-                lines=lines
-            )
-            blocks.append(text_block)
+                lines=lines,
+            ))
         
         return blocks
     
-    def _extract_characters(self, span: dict) -> list[CharacterInfo]:
-        """Extract character-level coordinates from a span."""
-        characters = []
+    def _extract_characters(self, span: dict) -> Optional[np.ndarray]:
+        """Extract character-level coordinates from a span as a CHAR_DTYPE array."""
         text = span.get("text", "")
         
         # PyMuPDF provides origin (x, y) for the span
         # We need to estimate character positions
         if not text:
-            return characters
+            return None
         
+        n = len(text)
         span_bbox = span["bbox"]
-        span_width = span_bbox[2] - span_bbox[0]
-        char_width = span_width / len(text) if text else 0
-        char_height = span_bbox[3] - span_bbox[1]
-        
-        x = span_bbox[0]
-        y = span_bbox[1]
-        
-        for char in text:
-            characters.append(CharacterInfo(
-                char=char,
-                x=x,
-                y=y,
-                width=char_width,
-                height=char_height,
-                font=span.get("font", ""),
-                size=span.get("size", 0),
-                color=span.get("color")
-            ))
-            x += char_width
-        
-        return characters
+        char_width = (span_bbox[2] - span_bbox[0]) / n
+        color = span.get("color")
+        
+        chars = np.empty(n, dtype=CHAR_DTYPE)
+        chars["char"] = list(text)
+        chars["x"] = span_bbox[0] + np.arange(n) * char_width
+        chars["y"] = span_bbox[1]
+        chars["w"] = char_width
+        chars["h"] = span_bbox[3] - span_bbox[1]
+        chars["size"] = span.get("size", 0)
+        chars["color"] = -1 if color is None else color
+        return chars
     
     def _detect_columns(self, blocks: list[TextBlock], page_width: float) -> list[TextBlock]:
         """Detect multi-column layout and assign column indices."""
@@ -400,33 +368,31 @@ class PDFProcessor:
         mid_point = page_width / 2
         threshold = page_width * 0.1  # 10% tolerance
         
-        left_blocks = []
-        right_blocks = []
-        center_blocks = []
-        
-        for block, center in zip(blocks, centers):
+        # 0 = left column, 1 = right column, None = centered (ambiguous)
+        columns: list[Optional[int]] = []
+        for center in centers:
             if center < mid_point - threshold:
-                left_blocks.append(block)
+                columns.append(0)
             elif center > mid_point + threshold:
-                right_blocks.append(block)
+                columns.append(1)
             else:
-                center_blocks.append(block)
+                columns.append(None)
         
         # Only assign columns if we have a clear two-column layout
-        if left_blocks and right_blocks and len(center_blocks) < len(blocks) * 0.3:
-            for block in left_blocks:
-                block.column_index = 0
-            for block in right_blocks:
-                block.column_index = 1
-            # Center blocks are ambiguous
-            for block in center_blocks:
-                block.column_index = None
-        else:
+        two_column = (
+            0 in columns
+            and 1 in columns
+            and columns.count(None) < len(blocks) * 0.3
+        )
+        if not two_column:
             # Single column layout
-            for block in blocks:
-                block.column_index = 0
+            columns = [0] * len(blocks)
         
-        return blocks
+        # Blocks are frozen; return updated copies
+        return [
+            block.model_copy(update={"column_index": column})
+            for block, column in zip(blocks, columns)
+        ]
     
     def _extract_tables(self, page: fitz.Page) -> list[TableData]:
         """
@@ -442,35 +408,31 @@ class PDFProcessor:
             page_tables = page.find_tables()
             
             for table in page_tables:
-                bbox = BoundingBox(
-                    x0=table.bbox[0],
-                    y0=table.bbox[1],
-                    x1=table.bbox[2],
-                    y1=table.bbox[3]
-                )
+                bbox = BoundingBox(*table.bbox)
                 
-                cells: list[TableCell] = []
+                cells: list[dict] = []
                 table_data = table.extract()
                 
                 for row_idx, row in enumerate(table_data):
                     for col_idx, cell_text in enumerate(row):
                         # PyMuPDF doesn't provide per-cell bboxes easily
                         # Create approximate cell bbox
-                        cells.append(TableCell(
-                            text=cell_text or "",
-                            row=row_idx,
-                            col=col_idx,
-                            bbox=bbox,  # Simplified - use table bbox
-                            rowspan=1,
-                            colspan=1
-                        ))
+                        cells.append({
+                            "text": cell_text or "",
+                            "row": row_idx,
+                            "col": col_idx,
+                            "bbox": bbox,  # Simplified - use table bbox
+                            "rowspan": 1,
+                            "colspan": 1,
+                        })
                 
-                tables.append(TableData(
-                    bbox=bbox,
-                    rows=len(table_data),
-                    cols=len(table_data[0]) if table_data else 0,
-                    cells=cells
-                ))
+                # One validation call per table, cells included
+                tables.append(TableData.model_validate({
+                    "bbox": bbox,
+                    "rows": len(table_data),
+                    "cols": len(table_data[0]) if table_data else 0,
+                    "cells": cells,
+                }))
                 
         except Exception as e:
             # Table detection may fail on some PDFs
@@ -2,7 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict, deque
 from typing import List, Dict, Any, Optional, Set, Callable
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 from pathlib import Path
 import json
@@ -32,6 +32,10 @@ class PipelineEdge(BaseModel):
     source: str
     target: str
 
+# One compiled validator per list type, reused for every executor
+_NODE_LIST_ADAPTER = TypeAdapter(List[PipelineNode])
+_EDGE_LIST_ADAPTER = TypeAdapter(List[PipelineEdge])
+
 class PipelineStatus(BaseModel):
     pipeline_id: str
     status: str  # PENDING, RUNNING, COMPLETED, FAILED, CANCELLED
@@ -55,8 +59,8 @@ class PipelineExecutor:
         pipeline_id: str = "default",
         progress_callback: Optional[Callable[[PipelineStatus], None]] = None
     ):
-        self.nodes = {n['id']: PipelineNode(**n) for n in nodes}
-        self.edges = [PipelineEdge(**e) for e in edges]
+        self.nodes = {n.id: n for n in _NODE_LIST_ADAPTER.validate_python(nodes)}
+        self.edges = _EDGE_LIST_ADAPTER.validate_python(edges)
         self.pipeline_id = pipeline_id
         self.callback = progress_callback
         
@@ -1,15 +1,43 @@
 from typing import List, Optional, Dict, Any
+import asyncio
 import json
 import os
 from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB
 
+from app.core.logging import get_logger
 from app.models.models import Preset, Pipeline, PipelineStatus, User
 
+logger = get_logger(__name__)
+
+
 class PresetService:
     def __init__(self):
         self.presets_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "presets")
+        # Set whenever no background seeding is in flight; endpoints that read
+        # presets await it so they never observe a half-seeded table.
+        self.ready_event = asyncio.Event()
+        self.ready_event.set()
+        self._seed_task: Optional[asyncio.Task] = None
+
+    def start_background_load(self) -> asyncio.Task:
+        """Seed builtin presets without blocking application startup."""
+        self.ready_event.clear()
+        self._seed_task = asyncio.create_task(self._seed_builtin_presets())
+        return self._seed_task
+
+    async def _seed_builtin_presets(self) -> None:
+        from app.core.database import async_session_maker
+        try:
+            async with async_session_maker() as db:
+                loaded = await self.load_builtin_presets(db)
+            logger.info("builtin_presets_loaded", count=len(loaded))
+        except Exception as e:
+            logger.exception("builtin_presets_load_failed", error=str(e))
+        finally:
+            self.ready_event.set()
 
     async def load_builtin_presets(self, db: AsyncSession) -> List[Preset]:
         """Load all JSON presets from the presets directory into the database"""
@@ -68,12 +96,32 @@ class PresetService:
         await db.commit()
         return loaded_presets
 
-    async def get_all_presets(self, db: AsyncSession, category: Optional[str] = None) -> List[Preset]:
-        """Fetch presets from database, optionally filtered by category"""
+    async def get_all_presets(
+        self,
+        db: AsyncSession,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        chunking_method: Optional[str] = None,
+    ) -> List[Preset]:
+        """Fetch presets from database, optionally filtered by category, tag and chunking method"""
+        # Plain select(): SQLAlchemy's compiled cache already keys on statement
+        # shape, and the filter values bind as ordinary parameters
         query = select(Preset).where(Preset.is_public == True)
         
         if category:
             query = query.where(Preset.category == category)
+        
+        if tag:
+            # JSONB containment (@>) is served by the jsonb_path_ops GIN index
+            query = query.where(Preset.tags.contains([tag]))
+        
+        if chunking_method:
+            # Literal '->' key so the planner matches idx_presets_config_chunking_gin
+            query = query.where(
+                Preset.configuration.op("->", return_type=JSONB)(
+                    literal_column("'chunking'")
+                ).contains({"method": chunking_method})
+            )
             
         result = await db.execute(query)
         return list(result.scalars().all())
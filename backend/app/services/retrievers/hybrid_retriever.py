@@ -1,8 +1,9 @@
 from typing import List, Dict, Any
 from uuid import UUID
 from sqlalchemy import select, text, func
-from app.models import Chunk, Document
+from app.models import Chunk, ChunkEmbedding, Document
 from app.services.retrievers.base import BaseRetriever
+from app.services.retrievers.vector_index import query_vector, tune_vector_search
 from app.dependencies import DbSession
 
 class HybridRetriever(BaseRetriever):
@@ -48,19 +49,19 @@ class HybridRetriever(BaseRetriever):
 
     async def _vector_search(self, embedding: List[float], limit: int, document_id: UUID = None) -> List[Dict]:
         """Vector similarity search using pgvector."""
-        embedding_str = f"[{','.join(map(str, embedding))}]"
+        distance = ChunkEmbedding.embedding.cosine_distance(query_vector(embedding))
+        order = await tune_vector_search(self.db, distance, limit, document_id)
         
+        # Raw distance uses the HNSW index; selective filters get an exact sort
         query = (
-            select(
-                Chunk,
-                (1 - Chunk.embedding.cosine_distance(text(f"'{embedding_str}'::vector"))).label("score")
-            )
-            .order_by(text("score DESC"))
+            select(Chunk, (1 - distance).label("score"))
+            .join(Chunk.embedding_record)
+            .order_by(order)
             .limit(limit)
         )
         
         if document_id:
-            query = query.where(Chunk.document_id == document_id)
+            query = query.where(ChunkEmbedding.document_id == document_id)
             
         result = await self.db.execute(query)
         return [{"chunk": row.Chunk, "score": float(row.score)} for row in result.all()]
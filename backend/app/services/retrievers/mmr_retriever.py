@@ -1,9 +1,11 @@
+import math
 from typing import List, Dict, Any
 from uuid import UUID
 import numpy as np
-from sqlalchemy import select, text
-from app.models import Chunk
+from sqlalchemy import select
+from app.models import Chunk, ChunkEmbedding
 from app.services.retrievers.base import BaseRetriever
+from app.services.retrievers.vector_index import query_vector, tune_vector_search
 from app.dependencies import DbSession
 
 class MMRRetriever(BaseRetriever):
@@ -37,19 +39,18 @@ class MMRRetriever(BaseRetriever):
         lambda_mult = kwargs.get("lambda_mult", self.lambda_mult)
         
         # 1. Fetch more candidates than needed
-        embedding_str = f"[{','.join(map(str, query_embedding))}]"
+        distance = ChunkEmbedding.embedding.cosine_distance(query_vector(query_embedding))
+        order = await tune_vector_search(self.db, distance, fetch_k, document_id)
         
         stmt = (
-            select(
-                Chunk,
-                (1 - Chunk.embedding.cosine_distance(text(f"'{embedding_str}'::vector"))).label("score")
-            )
-            .order_by(text("score DESC"))
+            select(Chunk, ChunkEmbedding.embedding, (1 - distance).label("score"))
+            .join(Chunk.embedding_record)
+            .order_by(order)
             .limit(fetch_k)
         )
         
         if document_id:
-            stmt = stmt.where(Chunk.document_id == document_id)
+            stmt = stmt.where(ChunkEmbedding.document_id == document_id)
             
         result = await self.db.execute(stmt)
         candidates = result.all()
@@ -58,8 +59,8 @@ class MMRRetriever(BaseRetriever):
             return []
             
         # 2. Extract embeddings for candidate similarity calcs
-        # (Assuming embeddings are already in the objects, but pgvector might return them as lists)
-        candidate_embeddings = [np.array(c.Chunk.embedding) for c in candidates]
+        # (selected alongside each chunk; pgvector returns them as arrays)
+        candidate_embeddings = [np.array(c.embedding) for c in candidates]
         query_emb = np.array(query_embedding)
         
         # 3. Apply MMR algorithm
@@ -95,7 +96,8 @@ class MMRRetriever(BaseRetriever):
         # or we can recalculate. Let's recalculate for consistency.
         
         def cosine_similarity(a, b):
-            return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+            # vdot + one sqrt avoids linalg.norm's generic (ord/axis) path twice
+            return np.dot(a, b) / math.sqrt(np.vdot(a, a) * np.vdot(b, b))
 
         similarities_to_query = [cosine_similarity(query_embedding, emb) for emb in doc_embeddings]
         
@@ -1,8 +1,9 @@
 from typing import List, Dict, Any
 from uuid import UUID
-from sqlalchemy import select, text
-from app.models import Chunk
+from sqlalchemy import select
+from app.models import Chunk, ChunkEmbedding
 from app.services.retrievers.base import BaseRetriever
+from app.services.retrievers.vector_index import query_vector, tune_vector_search
 from app.dependencies import DbSession
 
 class ParentDocumentRetriever(BaseRetriever):
@@ -27,22 +28,21 @@ class ParentDocumentRetriever(BaseRetriever):
             return []
             
         # 1. Fetch children (small chunks)
-        embedding_str = f"[{','.join(map(str, query_embedding))}]"
+        distance = ChunkEmbedding.embedding.cosine_distance(query_vector(query_embedding))
+        order = await tune_vector_search(self.db, distance, top_k * 2, document_id)
         
         # We look for chunks that HAVE a parent_chunk_id (children)
         # and are similar to the query.
         stmt = (
-            select(
-                Chunk,
-                (1 - Chunk.embedding.cosine_distance(text(f"'{embedding_str}'::vector"))).label("score")
-            )
+            select(Chunk, (1 - distance).label("score"))
+            .join(Chunk.embedding_record)
             .where(Chunk.parent_chunk_id.isnot(None))
-            .order_by(text("score DESC"))
+            .order_by(order)
             .limit(top_k * 2) # Fetch extra to account for duplicate parents
         )
         
         if document_id:
-            stmt = stmt.where(Chunk.document_id == document_id)
+            stmt = stmt.where(ChunkEmbedding.document_id == document_id)
             
         result = await self.db.execute(stmt)
         children = result.all()
@@ -50,15 +50,13 @@ class ParentDocumentRetriever(BaseRetriever):
         if not children:
             # Fallback to normal retrieval if no children found
             stmt_fallback = (
-                select(
-                    Chunk,
-                    (1 - Chunk.embedding.cosine_distance(text(f"'{embedding_str}'::vector"))).label("score")
-                )
-                .order_by(text("score DESC"))
+                select(Chunk, (1 - distance).label("score"))
+                .join(Chunk.embedding_record)
+                .order_by(order)
                 .limit(top_k)
             )
             if document_id:
-                stmt_fallback = stmt_fallback.where(Chunk.document_id == document_id)
+                stmt_fallback = stmt_fallback.where(ChunkEmbedding.document_id == document_id)
             result = await self.db.execute(stmt_fallback)
             return [{"chunk": row.Chunk, "score": float(row.score)} for row in result.all()]
 
@@ -71,7 +69,13 @@ class ParentDocumentRetriever(BaseRetriever):
                 
         # 3. Fetch parent chunks
         parent_ids = list(parent_scores.keys())
-        parent_stmt = select(Chunk).where(Chunk.id.in_(parent_ids))
+        # Parents share their child's document; filtering on the partition
+        # key lets PostgreSQL prune chunks partitions instead of probing all.
+        parent_doc_ids = {row.Chunk.document_id for row in children}
+        parent_stmt = select(Chunk).where(
+            Chunk.id.in_(parent_ids),
+            Chunk.document_id.in_(parent_doc_ids),
+        )
         parent_result = await self.db.execute(parent_stmt)
         parents = parent_result.scalars().all()
         
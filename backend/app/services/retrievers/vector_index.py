@@ -0,0 +1,90 @@
+"""
+pgvector index tuning helpers shared by the vector retrievers.
+"""
+from typing import Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import bindparam, cast, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.config import settings
+from app.core.errors import BadRequestError
+
+
+# Largest finite float16; halfvec rejects anything beyond it
+_HALFVEC_MAX = 65504.0
+
+
+def query_vector(values: Sequence[float]) -> ColumnElement:
+    """
+    Bind a query embedding as a halfvec parameter.
+
+    ChunkEmbedding.embedding is stored as halfvec, so the parameter is cast to
+    the same type for the halfvec_cosine_ops index to apply. Binding rather
+    than inlining the values keeps the SQL identical across searches, so the
+    compiled statement and asyncpg's prepared statement are reused.
+    Raises BadRequestError for values halfvec cannot represent.
+    """
+    vector = np.asarray(values, dtype=np.float32)
+    if not np.isfinite(vector).all() or np.abs(vector).max(initial=0.0) > _HALFVEC_MAX:
+        raise BadRequestError("Query embedding values must be finite and within ±65504")
+    halfvec = HALFVEC(len(vector))
+    return cast(bindparam("query_embedding", vector, type_=halfvec, unique=True), halfvec)
+
+
+def _is_postgres(db: AsyncSession) -> bool:
+    bind = db.bind
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+async def _filter_selectivity(db: AsyncSession, document_id: UUID) -> float:
+    """Fraction of embedding rows matched by a document_id filter."""
+    # Both sides count chunk_embeddings rows: reltuples is the planner's
+    # estimate (a catalog read), the per-document count is an index-only
+    # scan on ix_chunk_embeddings_document_id. One round trip for both.
+    total, matched = (await db.execute(
+        text(
+            "SELECT (SELECT reltuples FROM pg_class WHERE relname = 'chunk_embeddings'), "
+            "(SELECT count(*) FROM chunk_embeddings WHERE document_id = :document_id)"
+        ),
+        {"document_id": document_id},
+    )).one()
+    if not total or total <= 0:
+        return 1.0
+    return matched / total
+
+
+async def tune_vector_search(
+    db: AsyncSession,
+    distance: ColumnElement,
+    limit: int,
+    document_id: Optional[UUID] = None,
+) -> ColumnElement:
+    """
+    Set per-transaction ANN parameters and pick the ORDER BY for a similarity query.
+
+    ef_search must be at least the LIMIT or the HNSW scan returns fewer
+    rows than asked for. When a document filter is highly selective, the
+    HNSW graph walk visits mostly filtered-out nodes and can terminate
+    early, so the returned ordering is ``distance + 0``: an expression the
+    HNSW operator class cannot serve, which leaves the planner a scan on
+    document_id plus an exact sort. That is both cheaper and exact for
+    small subsets, and unlike disabling index scans it does not leak into
+    later statements of the same transaction. Otherwise ``distance`` itself
+    is returned so the HNSW index applies. No settings are changed on
+    non-PostgreSQL backends.
+    """
+    if not _is_postgres(db):
+        return distance
+    # SET does not accept bind parameters; values are validated ints.
+    ef_search = max(int(settings.hnsw_ef_search), int(limit))
+    await db.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+    
+    if document_id is not None:
+        selectivity = await _filter_selectivity(db, document_id)
+        if selectivity < settings.vector_exact_scan_selectivity:
+            return distance + 0
+    return distance
@@ -1,6 +1,7 @@
 """
 Document Endpoints Integration Tests
 """
+import hashlib
 import io
 import pytest
 import pytest_asyncio
@@ -59,6 +60,63 @@ async def test_upload_pdf_success(client: AsyncClient, auth_headers: dict, tmp_p
     assert data["is_processed"] is False
 
 
+@pytest.mark.asyncio
+async def test_upload_duplicate_reuses_document(client: AsyncClient, auth_headers: dict):
+    """Re-uploading identical bytes returns the existing document."""
+    pdf_content = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF duplicate"
+
+    first = await client.post(
+        "/api/v1/documents/upload",
+        headers=auth_headers,
+        files={"file": ("a.pdf", io.BytesIO(pdf_content), "application/pdf")},
+    )
+    second = await client.post(
+        "/api/v1/documents/upload",
+        headers=auth_headers,
+        files={"file": ("b.pdf", io.BytesIO(pdf_content), "application/pdf")},
+    )
+
+    assert first.status_code == 201
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["original_filename"] == "a.pdf"
+    assert second.json()["file_size_bytes"] == len(pdf_content)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failed, file_exists", [(True, True), (False, False)])
+async def test_upload_duplicate_of_unusable_document_creates_new(
+    client: AsyncClient, auth_headers: dict, test_db, test_user: User, tmp_path, failed, file_exists
+):
+    """A matching document that failed processing or lost its file is not reused."""
+    pdf_content = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF stale"
+    stored = tmp_path / "stale.pdf"
+    if file_exists:
+        stored.write_bytes(pdf_content)
+    stale = Document(
+        user_id=test_user.id,
+        filename="stale.pdf",
+        original_filename="stale.pdf",
+        file_path=str(stored),
+        file_type=DocumentType.PDF,
+        file_size_bytes=len(pdf_content),
+        content_hash=hashlib.blake2b(pdf_content, digest_size=16).hexdigest(),
+        doc_metadata={"processing_error": "boom"} if failed else {},
+        is_processed=False,
+    )
+    test_db.add(stale)
+    await test_db.commit()
+
+    response = await client.post(
+        "/api/v1/documents/upload",
+        headers=auth_headers,
+        files={"file": ("stale.pdf", io.BytesIO(pdf_content), "application/pdf")},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["id"] != str(stale.id)
+
+
 @pytest.mark.asyncio
 async def test_upload_invalid_file_type(client: AsyncClient, auth_headers: dict):
     """Test rejection of invalid file types."""
@@ -115,6 +173,22 @@ async def test_get_document(client: AsyncClient, auth_headers: dict, test_docume
     assert data["extracted_text"] == test_document.extracted_text
 
 
+@pytest.mark.asyncio
+async def test_stream_document_text(client: AsyncClient, auth_headers: dict, test_document: Document, monkeypatch):
+    """Test extracted text is streamed back in slices."""
+    from app.api.v1 import documents
+    monkeypatch.setattr(documents, "TEXT_STREAM_SLICE_CHARS", 10)
+    
+    response = await client.get(
+        f"/api/v1/documents/{test_document.id}/text",
+        headers=auth_headers,
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == test_document.extracted_text
+
+
 @pytest.mark.asyncio
 async def test_get_document_not_found(client: AsyncClient, auth_headers: dict):
     """Test 404 for non-existent document."""
@@ -0,0 +1,35 @@
+"""
+Rate limit handler tests
+"""
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+
+from app.core.rate_limit import get_user_id_or_ip, rate_limit_exceeded_handler
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_response_keeps_headers():
+    """The cached 429 body still carries Retry-After and X-RateLimit-* headers."""
+    limiter = Limiter(key_func=get_user_id_or_ip, storage_uri="memory://")
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
+    @app.get("/limited")
+    @limiter.limit("1/minute")
+    async def limited(request: Request):
+        return {"ok": True}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        assert (await ac.get("/limited")).status_code == 200
+        response = await ac.get("/limited")
+
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+    assert response.headers["X-RateLimit-Limit"] == "1"
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    assert response.json()["error"] == "Rate limit exceeded: 1 per 1 minute"
+    assert response.json()["code"] == "RATE_LIMIT_EXCEEDED"
@@ -2,15 +2,16 @@
 Pytest Configuration and Fixtures
 """
 import asyncio
+import json
 from typing import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy import JSON
+from sqlalchemy import JSON, event
 
-from app.config import Settings
+from app.config import Settings, settings
 from app.core.database import get_db
 from app.main import create_app
 from app.models import Base
@@ -37,9 +38,52 @@ def _patch_types_for_sqlite():
     if not hasattr(SQLiteTypeCompiler, 'visit_TSVECTOR'):
         SQLiteTypeCompiler.visit_TSVECTOR = lambda self, type_, **kw: "TEXT"
 
+    # JSONB @> -> jsonb_contains() (registered per connection below)
+    from sqlalchemy.dialects.sqlite.base import SQLiteCompiler
+    if not hasattr(SQLiteCompiler, "_pg_visit_custom_op_binary"):
+        SQLiteCompiler._pg_visit_custom_op_binary = SQLiteCompiler.visit_custom_op_binary
+
+        def visit_custom_op_binary(self, element, operator, **kw):
+            if operator.opstring == "@>":
+                return "jsonb_contains(%s, %s)" % (
+                    self.process(element.left, **kw),
+                    self.process(element.right, **kw),
+                )
+            return self._pg_visit_custom_op_binary(element, operator, **kw)
+
+        SQLiteCompiler.visit_custom_op_binary = visit_custom_op_binary
+
 _patch_types_for_sqlite()
 
 
+def _jsonb_contains(container, contained) -> bool:
+    """PostgreSQL jsonb @> semantics over decoded JSON values."""
+    if isinstance(container, dict) and isinstance(contained, dict):
+        return all(
+            key in container and _jsonb_contains(container[key], value)
+            for key, value in contained.items()
+        )
+    if isinstance(container, list):
+        if isinstance(contained, list):
+            return all(any(_jsonb_contains(c, v) for c in container) for v in contained)
+        return any(_jsonb_contains(c, contained) for c in container)
+    return container == contained
+
+
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    """Stand-ins for PostgreSQL functions used in generated columns."""
+    # chunks.tsv is GENERATED from to_tsvector(); SQLite only needs it to exist
+    dbapi_connection.create_function(
+        "to_tsvector", 2, lambda config, text: text, deterministic=True
+    )
+    # JSONB containment, used by the preset tag / chunking method filters
+    dbapi_connection.create_function(
+        "jsonb_contains", 2,
+        lambda left, right: left is not None and _jsonb_contains(json.loads(left), json.loads(right)),
+        deterministic=True,
+    )
+
+
 # Test database URL (in-memory SQLite for speed)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -48,10 +92,18 @@ app = create_app()
 
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_dirs(tmp_path_factory):
+    """Keep diskcache and exported ONNX models out of the working tree."""
+    settings.cache_dir = str(tmp_path_factory.mktemp("cache"))
+    settings.onnx_model_dir = str(tmp_path_factory.mktemp("onnx"))
+
+
 @pytest_asyncio.fixture
 async def test_db() -> AsyncGenerator[AsyncSession, None]:
     """Create a fresh test database for each test."""
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    event.listen(engine.sync_engine, "connect", _register_sqlite_functions)
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
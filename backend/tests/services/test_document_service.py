@@ -0,0 +1,125 @@
+"""
+Tests for DocumentService chunk persistence
+"""
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import select
+
+from app.core.errors import BadRequestError
+from app.models import Chunk, ChunkingMethod, Document, DocumentType, User
+from app.services.document_service import (
+    COPY_BATCH_THRESHOLD,
+    DocumentService,
+    document_service,
+)
+
+
+@pytest.mark.asyncio
+async def test_save_chunks_bulk_insert(test_db):
+    """Non-asyncpg backends persist large batches with a Core bulk insert."""
+    user = User(email="chunks@example.com", password_hash="x")
+    test_db.add(user)
+    await test_db.flush()
+    document = Document(
+        user_id=user.id,
+        filename="doc.pdf",
+        original_filename="doc.pdf",
+        file_path="/tmp/doc.pdf",
+        file_type=DocumentType.PDF,
+    )
+    test_db.add(document)
+    await test_db.flush()
+
+    n = COPY_BATCH_THRESHOLD + 5
+    chunks_data = [
+        {"text": f"chunk {i}", "start": i * 10, "end": i * 10 + 7}
+        for i in range(n)
+    ]
+
+    count = await document_service._save_chunks(
+        test_db,
+        document.id,
+        chunks_data,
+        method=ChunkingMethod.RECURSIVE,
+        chunk_size=512,
+        overlap=50,
+    )
+    await test_db.flush()
+
+    assert count == n
+    result = await test_db.execute(
+        select(Chunk).where(Chunk.document_id == document.id).order_by(Chunk.chunk_index)
+    )
+    chunks = result.scalars().all()
+    assert len(chunks) == n
+    assert chunks[3].text == "chunk 3"
+    assert chunks[3].chunk_metadata == {"start": 30, "end": 37}
+    assert chunks[0].chunking_method == ChunkingMethod.RECURSIVE
+
+
+@pytest.mark.asyncio
+async def test_save_chunks_empty(test_db):
+    """An empty chunker result writes nothing."""
+    count = await document_service._save_chunks(
+        test_db,
+        None,
+        [],
+        method=ChunkingMethod.RECURSIVE,
+        chunk_size=512,
+        overlap=50,
+    )
+    assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_validate_and_save_hashes_in_one_pass(tmp_path):
+    """The saved copy, size and content hash all come from the same read."""
+    data = b"%PDF-1.4\n" + b"x" * (3 << 20)
+    service = DocumentService(upload_dir=str(tmp_path))
+
+    saved = await service.validate_and_save(UploadFile(io.BytesIO(data), filename="a.pdf"))
+
+    assert saved.file_type == DocumentType.PDF
+    assert saved.size_bytes == len(data)
+    assert saved.content_hash == hashlib.blake2b(data, digest_size=16).hexdigest()
+    with open(saved.file_path, "rb") as f:
+        assert f.read() == data
+
+
+@pytest.mark.asyncio
+async def test_validate_and_save_rejects_oversized(tmp_path):
+    """Oversized uploads are rejected and leave no partial file behind."""
+    service = DocumentService(upload_dir=str(tmp_path))
+    service.max_size_bytes = 1024
+
+    with pytest.raises(BadRequestError, match="too large"):
+        await service.validate_and_save(
+            UploadFile(io.BytesIO(b"a" * 2048), filename="big.txt")
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_mark_failed_records_error(test_db):
+    """Processing failures are recorded on the document's metadata."""
+    user = User(email="failed@example.com", password_hash="x")
+    test_db.add(user)
+    await test_db.flush()
+    doc = Document(
+        user_id=user.id,
+        filename="f.pdf",
+        original_filename="f.pdf",
+        file_path="./uploads/f.pdf",
+        file_type=DocumentType.PDF,
+        doc_metadata={"page_count": 1},
+    )
+    test_db.add(doc)
+    await test_db.commit()
+
+    await document_service._mark_failed(test_db, doc.id, "boom")
+
+    await test_db.refresh(doc)
+    assert doc.doc_metadata == {"page_count": 1, "processing_error": "boom"}
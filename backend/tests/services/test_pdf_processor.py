@@ -210,7 +210,20 @@ class TestCoordinateExtraction:
                             assert char.height > 0
         
         assert found_characters, "No characters extracted"
-    
+
+    def test_span_characters_serialize_as_before(self, processor: PDFProcessor, sample_pdf_path: Path):
+        """Spans dump characters under their original key and coordinates."""
+        options = ExtractionOptions(extract_characters=True)
+        result = processor.extract_document(sample_pdf_path, options)
+        span = next(
+            s for b in result.pages[0].blocks for l in b.lines for s in l.spans if s.text
+        )
+
+        dumped = span.model_dump()
+        assert "char_array" not in dumped
+        assert dumped["characters"] == [c.model_dump() for c in span.characters]
+        assert dumped["characters"][0]["x"] == span.bbox.x0
+
     def test_block_types(self, processor: PDFProcessor, sample_pdf_path: Path):
         """Test that blocks have correct types."""
         result = processor.extract_document(sample_pdf_path)
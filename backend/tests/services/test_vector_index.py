@@ -0,0 +1,76 @@
+"""
+Vector search tuning tests
+"""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.errors import BadRequestError
+from app.models import ChunkEmbedding
+from app.services.retrievers.vector_index import query_vector, tune_vector_search
+
+
+class _FakePostgresSession:
+    """Records statements and answers the selectivity lookup."""
+
+    def __init__(self, total: float, matched):
+        self.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        self.statements = []
+        self._row = (total, matched)
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return SimpleNamespace(one=lambda: self._row)
+
+
+def _distance():
+    return ChunkEmbedding.embedding.cosine_distance(query_vector([0.1, 0.2]))
+
+
+def test_query_vector_binds_values():
+    """Different embeddings compile to the same SQL; values travel as parameters."""
+    from sqlalchemy.dialects import postgresql
+
+    compiled = [
+        ChunkEmbedding.embedding.cosine_distance(query_vector(v)).compile(dialect=postgresql.dialect())
+        for v in ([0.1, 0.2], [0.3, 0.4])
+    ]
+    assert str(compiled[0]) == str(compiled[1])
+    assert "0.1" not in str(compiled[0])
+
+
+@pytest.mark.parametrize("values", [[1e6, 0.0], [float("nan"), 0.0]])
+def test_query_vector_rejects_values_outside_halfvec(values):
+    with pytest.raises(BadRequestError):
+        query_vector(values)
+
+
+@pytest.mark.asyncio
+async def test_selective_filter_sorts_exactly_without_session_settings():
+    """A selective filter changes the ORDER BY, not enable_indexscan."""
+    db = _FakePostgresSession(total=10_000.0, matched=12)
+    distance = _distance()
+
+    order = await tune_vector_search(db, distance, 10, uuid4())
+
+    assert order is not distance
+    assert "+" in str(order)
+    assert not any("enable_indexscan" in s for s in db.statements)
+    # ef_search plus a single selectivity lookup
+    assert len(db.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_broad_filter_keeps_index_order():
+    db = _FakePostgresSession(total=10_000.0, matched=5_000)
+    distance = _distance()
+
+    assert await tune_vector_search(db, distance, 10, uuid4()) is distance
+    assert db.statements[0] == "SET LOCAL hnsw.ef_search = 100"
+
+
+@pytest.mark.asyncio
+async def test_non_postgres_is_untouched(test_db):
+    distance = _distance()
+    assert await tune_vector_search(test_db, distance, 10, uuid4()) is distance
@@ -1,10 +1,23 @@
+import re
+import sys
+
+import numpy as np
+import torch
 import pytest
 from app.services.chunkers.sentence_window_chunker import SentenceWindowChunker
 from app.services.chunkers.paragraph_chunker import ParagraphChunker
 from app.services.chunkers.code_aware_chunker import CodeAwareChunker
 from app.services.chunkers.heading_based_chunker import HeadingBasedChunker
 from app.services.chunkers.recursive_chunker import RecursiveChunker
+from app.services.chunkers.base import SPACE
+from app.services.chunkers.semantic_chunker import _gap_similarities
 from app.schemas.chunk import ChunkingConfig
+from app.services.chunker import (
+    _sentence_spans,
+    apply_chunking,
+    fixed_size_spans,
+    recursive_chunking,
+)
 
 SAMPLE_TEXT = """# Section 1
 This is the first paragraph. It has two sentences.
@@ -121,3 +134,102 @@ def test_recursive_chunker(config):
     chunks = chunker.chunk(text, config)
     assert len(chunks) == 5
     assert len(chunks[0]["text"]) == 20
+
+
+def test_recursive_chunker_offsets_with_repeated_text(config):
+    chunker = RecursiveChunker()
+    # Identical paragraphs: offsets must not collapse onto the first copy
+    text = "\n\n".join(["same words here"] * 4)
+    config.chunk_size = 20
+    config.overlap = 0
+    
+    chunks = chunker.chunk(text, config)
+    assert len(chunks) == 4
+    assert [c["start_char"] for c in chunks] == [0, 17, 34, 51]
+    for c in chunks:
+        assert text[c["start_char"]:c["end_char"]] == c["text"]
+
+
+def test_recursive_chunker_oversized_pieces_keep_offsets(config):
+    chunker = RecursiveChunker()
+    # The first paragraph is too long and is re-split by line, then by word
+    text = "short para\n\n" + "\n".join(["alpha beta gamma delta"] * 3) + "\n\ntail"
+    config.chunk_size = 15
+    config.overlap = 0
+    
+    chunks = chunker.chunk(text, config)
+    assert [c["text"] for c in chunks] == [
+        "short para", "alpha beta", "gamma delta", "alpha beta",
+        "gamma delta", "alpha beta", "gamma delta", "tail",
+    ]
+    for c in chunks:
+        assert text[c["start_char"]:c["end_char"]] == c["text"]
+
+
+def test_sentence_spans_match_regex_split():
+    import re
+    for text in [
+        "",
+        "No terminator here",
+        "One. Two!  Three?\nFour.",
+        "Trailing space. ",
+        "Wide\u3000space.\u3000Next. \u00e9t\u00e9!\tEnd",
+        "Abbrev e.g.x stays. Ellipsis...  next",
+    ]:
+        spans = [text[start:end] for start, end in _sentence_spans(text)]
+        assert spans == re.split(r"(?<=[.!?])\s+", text)
+
+
+def test_recursive_chunking_offsets_slice_original():
+    text = "Para one here. More.\n\nPara two is longer than that.\nline two"
+    chunks = recursive_chunking(text, chunk_size=25, overlap=0)
+    
+    assert [c["text"] for c in chunks] == [
+        "Para one here. More.\n\n",
+        "Para two is longer than ",
+        "that.\n",
+        "line two",
+    ]
+    for c in chunks:
+        assert text[c["start"]:c["end"]] == c["text"]
+        assert len(c["text"]) <= 25
+
+
+def test_space_class_matches_python_whitespace():
+    """SPACE spells out exactly what Python's Unicode \\s matches."""
+    space = re.compile(SPACE)
+    for cp in range(sys.maxunicode + 1):
+        ch = chr(cp)
+        assert bool(space.match(ch)) == bool(re.match(r"\s", ch)), hex(cp)
+
+
+def test_paragraph_split_on_unicode_blank_line():
+    """A blank line holding only NBSP still separates paragraphs."""
+    config = ChunkingConfig(method="paragraph", chunk_size=10, overlap=0)
+    chunks = ParagraphChunker().chunk("First.\n\u00a0\nSecond.", config)
+    assert [c["text"].strip() for c in chunks] == ["First.", "Second."]
+
+
+def test_fixed_size_spans_are_offsets():
+    text = "abcdefghij" * 3
+    spans = fixed_size_spans(text, chunk_size=12, overlap=2)
+    
+    assert spans.starts.tolist() == [0, 10, 20]
+    assert spans.ends.tolist() == [12, 22, 30]
+    assert spans.sizes().tolist() == [12, 12, 10]
+    assert [c["text"] for c in spans.to_dicts()] == [text[0:12], text[10:22], text[20:30]]
+
+
+def test_gap_similarities_match_windowed_means():
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((12, 8)).astype(np.float32)
+    window = 3
+    
+    expected = []
+    for i in range(len(embeddings) - 1):
+        left = embeddings[max(0, i - window + 1):i + 1].mean(axis=0)
+        right = embeddings[i + 1:i + 1 + window].mean(axis=0)
+        expected.append(left @ right / (np.linalg.norm(left) * np.linalg.norm(right)))
+    
+    got = _gap_similarities(torch.from_numpy(embeddings), window)
+    assert np.allclose(got, expected, atol=1e-5)
@@ -1,12 +1,13 @@
 """
 Tests for Document Analyzer Service
 """
+import numpy as np
 import pytest
 from pathlib import Path
 from httpx import AsyncClient
 
 from app.main import create_app
-from app.services.document_analyzer import document_analyzer
+from app.services.document_analyzer import DocumentAnalyzer, document_analyzer
 
 
 # Test fixtures paths
@@ -19,6 +20,48 @@ BLOG_PDF = FIXTURES_DIR / "blog_post.pdf"
 class TestDocumentAnalyzer:
     """Test the DocumentAnalyzer service"""
     
+    def test_classification_is_memoized(self):
+        """Repeated samples reuse the first zero-shot result"""
+        analyzer = DocumentAnalyzer()
+        analyzer._disk_cache = None
+        calls = []
+        
+        def classifier(text, labels):
+            calls.append(text)
+            return np.array([0.8] + [0.2 / (len(labels) - 1)] * (len(labels) - 1))
+        
+        analyzer._classifier = classifier
+        analyzer._initialized = True
+        
+        assert analyzer._classify_document("same sample") == ("legal", 0.8)
+        assert analyzer._classify_document("same sample") == ("legal", 0.8)
+        assert calls == ["same sample"]
+
+    def test_disk_cache_opens_on_first_use(self, tmp_path, monkeypatch):
+        """Constructing the analyzer touches no disk; the first lookup opens the cache"""
+        pytest.importorskip("diskcache")
+        from app.config import settings
+        monkeypatch.setattr(settings, "cache_dir", str(tmp_path))
+
+        analyzer = DocumentAnalyzer()
+        assert not (tmp_path / "zeroshot").exists()
+
+        analyzer._store_classification(b"k" * 16, ("legal", 0.9))
+        assert (tmp_path / "zeroshot").exists()
+        assert DocumentAnalyzer()._cached_classification(b"k" * 16) == ("legal", 0.9)
+
+    def test_near_empty_text_skips_classifier(self):
+        """Scanned PDFs with no extractable text never reach the model"""
+        analyzer = DocumentAnalyzer()
+
+        def classifier(text, labels):
+            raise AssertionError("classifier should not run")
+
+        analyzer._classifier = classifier
+        analyzer._initialized = True
+
+        assert analyzer._classify_or_quick("   \n  ") == ("general", 0.3)
+
     @pytest.mark.asyncio
     async def test_analyze_legal_document(self):
         """Test analysis of a legal contract"""
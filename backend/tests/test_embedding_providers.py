@@ -1,7 +1,13 @@
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
-from app.services.embeddings import get_embedder, OpenAIEmbedder, LocalHuggingFaceEmbedder
+from app.services.embeddings import (
+    BaseEmbedder,
+    CachedEmbedderWrapper,
+    LocalHuggingFaceEmbedder,
+    OpenAIEmbedder,
+    get_embedder,
+)
 from app.services.cost_calculator import EmbeddingCostCalculator
 
 @pytest.mark.asyncio
@@ -55,10 +61,42 @@ def test_cost_calculator():
 
 def test_embedder_factory():
     openai = get_embedder("openai", "text-embedding-ada-002", api_key="abc")
-    assert isinstance(openai, OpenAIEmbedder)
+    # Unwrap the persistent cache layer when diskcache is installed
+    assert isinstance(getattr(openai, "inner", openai), OpenAIEmbedder)
     
     local = get_embedder("local", "all-MiniLM-L6-v2")
-    assert isinstance(local, LocalHuggingFaceEmbedder)
+    assert isinstance(getattr(local, "inner", local), LocalHuggingFaceEmbedder)
+    
+    # Memoized: one instance (and one loaded model) per configuration
+    assert get_embedder("local", "all-MiniLM-L6-v2") is local
+    assert get_embedder("openai", "text-embedding-ada-002", api_key="abc") is openai
+    assert get_embedder("openai", "text-embedding-ada-002", api_key="xyz") is not openai
     
     with pytest.raises(ValueError):
         get_embedder("invalid", "model")
+
+
+class _CountingEmbedder(BaseEmbedder):
+    provider_name = "fake"
+    model_name = "fake-model"
+    dimensions = 1
+    cost_per_million_tokens = 0.0
+
+    def __init__(self):
+        self.calls = []
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_cached_embedder_only_embeds_misses():
+    inner = _CountingEmbedder()
+    embedder = CachedEmbedderWrapper(inner, {})
+
+    assert await embedder.embed(["a", "bb", "a"]) == [[1.0], [2.0], [1.0]]
+    assert await embedder.embed(["bb", "ccc"]) == [[2.0], [3.0]]
+
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    assert embedder.model_name == "fake-model"
@@ -8,9 +8,10 @@ from app.services.retrievers.parent_document_retriever import ParentDocumentRetr
 from app.models import Chunk
 
 class MockRow:
-    def __init__(self, chunk, score):
+    def __init__(self, chunk, score, embedding=None):
         self.Chunk = chunk
         self.score = score
+        self.embedding = embedding
 
 @pytest.fixture
 def mock_db():
@@ -86,9 +87,9 @@ async def test_mmr_reduces_redundancy(mock_db):
     c3.embedding = [0.0, 1.0, 0.0] + [0.0]*1533
     
     mock_results = [
-        MockRow(c1, 1.0),
-        MockRow(c2, 0.99),
-        MockRow(c3, 0.5)
+        MockRow(c1, 1.0, c1.embedding),
+        MockRow(c2, 0.99, c2.embedding),
+        MockRow(c3, 0.5, c3.embedding)
     ]
     
     mock_db.execute = AsyncMock(return_value=MagicMock(all=lambda: mock_results))
@@ -119,3 +119,26 @@ async def test_preset_api_endpoints(client: AsyncClient, test_db, clean_presets,
     data = response.json()
     assert data["message"] == "Pipeline created successfully from preset"
     assert "pipeline_id" in data
+
+@pytest.mark.asyncio
+async def test_preset_api_filters(client: AsyncClient, test_db, clean_presets, auth_headers):
+    """Tag and chunking method filters reach the database without erroring"""
+    await preset_service.load_builtin_presets(test_db)
+    legal = next(p for p in await preset_service.get_all_presets(test_db) if p.name == "Legal Document QA")
+    tag = legal.tags[0]
+
+    response = await client.get("/api/v1/presets", params={"tag": tag}, headers=auth_headers)
+    assert response.status_code == 200
+    assert legal.name in [p["name"] for p in response.json()]
+    assert all(tag in p["tags"] for p in response.json())
+
+    response = await client.get(
+        "/api/v1/presets", params={"chunking_method": "paragraph_based"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    expected = {
+        p.name for p in await preset_service.get_all_presets(test_db)
+        if p.configuration.get("chunking", {}).get("method") == "paragraph_based"
+    }
+    assert legal.name in expected
+    assert {p["name"] for p in response.json()} == expected